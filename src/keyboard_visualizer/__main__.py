@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import sys
+import stat
 import argparse
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from keyboard_visualizer.ui.main_window import MainWindow
+from keyboard_visualizer.ui.main_window import MainWindow, MAIN_WINDOW_STYLE
+from keyboard_visualizer.ui.dialogs.settings_dialog import DIALOG_STYLE
 
 
 def parse_arguments():
@@ -32,11 +34,15 @@ def validate_file_path(file_path: str) -> Path:
     """Validate that the file path exists and is readable."""
     path = Path(file_path)
 
-    if not path.exists():
+    # A single stat call answers both "does it exist" and "is it a file"
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        # Also covers a file used as a directory and symlink loops
         print(f"Error: File '{file_path}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         print(f"Error: '{file_path}' is not a file.", file=sys.stderr)
         sys.exit(1)
 
@@ -75,6 +81,8 @@ def main() -> None:
     app.setApplicationName("Keyboard Visualizer")
     app.setApplicationVersion("0.1.0")
     app.setOrganizationName("KeyViz")
+    # Dialog rules come last so they win over the main window's inside dialogs
+    app.setStyleSheet(MAIN_WINDOW_STYLE + DIALOG_STYLE)
 
     # Create main window with optional file path
     try:
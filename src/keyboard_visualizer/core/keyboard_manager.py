@@ -1,49 +1,81 @@
 import json
-import os
-import sys
-import time
+import select
+import socket
 from pathlib import Path
 import subprocess
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QSocketNotifier, pyqtSignal
 from PyQt6.QtWidgets import QDialog, QMessageBox
 from keyboard_visualizer.utils.sudo_helper import SudoHelper
 from keyboard_visualizer.ui.dialogs.settings_dialog import PasswordDialog
 
+# Compact JSON separators for messages exchanged with the keyboard helper
+IPC_SEPARATORS = (",", ":")
+# Largest message accepted from the keyboard helper, in bytes
+MAX_MESSAGE_SIZE = 65536
 
-class KeyboardManager:
+
+class KeyboardManager(QObject):
     """
     Manages keyboard input monitoring with elevated privileges.
 
     This class handles the creation and management of a helper process that runs
     with elevated privileges to monitor keyboard input. It provides methods for
     authenticating with sudo, starting/stopping the helper process, and communicating
-    with it to monitor specific keys or wait for key presses.
+    with it to monitor specific keys or capture key presses.
+
+    The manager listens on a Unix domain socket that the keyboard helper process
+    connects to. Every command and response is a single JSON-encoded packet on
+    that connection, so the main application can wait for responses without
+    polling and read key state updates without touching the filesystem.
+
+    While keys are being monitored or a key is being captured, a socket
+    notifier wakes the manager up as soon as the helper sends a message. New
+    key states are published through the state_changed signal and captured
+    keys through the key_captured signal.
 
-    The manager uses temporary files for inter-process communication with the
-    keyboard helper process, allowing for real-time monitoring of keyboard states
-    without blocking the main application.
+    Signals:
+        state_changed (dict): Emitted with the scan codes whose state changed
+            and their new state, whenever the helper reports such a change.
+        key_captured (dict): Emitted with the scan code and name of the key
+            pressed after capture_key() was called.
 
     Attributes:
-        tmp_dir (Path): Directory for temporary communication files.
-        command_file (Path): File used to send commands to the helper process.
-        response_file (Path): File used to receive responses from the helper process.
-        running_file (Path): File indicating the helper process is running.
+        tmp_dir (Path): Directory holding the communication socket.
+        socket_path (Path): Path of the Unix domain socket the helper connects to.
+        server (Optional[socket.socket]): Listening socket awaiting the helper.
+        connection (Optional[socket.socket]): Connection to the helper process.
+        notifier (Optional[QSocketNotifier]): Notifier for incoming messages,
+            enabled only while keys are being monitored or captured.
+        monitoring (bool): Whether the helper is monitoring keys.
+        capturing (bool): Whether a key capture is waiting for a key press.
+        key_states (Dict[int, bool]): Latest state of each monitored key, built
+            from the changes reported by the helper process.
         helper_process (Optional[subprocess.Popen]): The running helper process.
         sudo (SudoHelper): Helper for managing sudo authentication and execution.
     """
 
+    state_changed = pyqtSignal(dict)
+    key_captured = pyqtSignal(dict)
+
     def __init__(self) -> None:
         """
         Initialize the KeyboardManager.
 
-        Sets up the temporary directory structure for inter-process communication
-        and initializes the sudo helper. Creates the temporary directory if it
+        Sets up the temporary directory for the communication socket and
+        initializes the sudo helper. Creates the temporary directory if it
         doesn't already exist.
         """
+        super().__init__()
         self.tmp_dir: Path = Path("/tmp/keyboard_visualizer")
-        self.command_file: Path = self.tmp_dir / "command"
-        self.response_file: Path = self.tmp_dir / "response"
-        self.running_file: Path = self.tmp_dir / "running"
+        self.socket_path: Path = self.tmp_dir / "socket"
+        self.server: Optional[socket.socket] = None
+        self.connection: Optional[socket.socket] = None
+        self.notifier: Optional[QSocketNotifier] = None
+        self.monitoring: bool = False
+        self.capturing: bool = False
+        self.key_states: Dict[int, bool] = {}
         self.helper_process: Optional[subprocess.Popen] = None
         self.sudo: SudoHelper = SudoHelper()
 
@@ -54,9 +86,11 @@ class KeyboardManager:
         """
         Get sudo authentication from user through a password dialog.
 
-        Displays a password dialog to the user and attempts to authenticate
-        with sudo using the provided password. Will continue prompting until
-        the user either provides the correct password or cancels the dialog.
+        If sudo still has valid cached credentials, no password is needed and
+        no dialog is shown. Otherwise displays a password dialog to the user
+        and attempts to authenticate with sudo using the provided password.
+        Will continue prompting until the user either provides the correct
+        password or cancels the dialog.
 
         Returns:
             bool: True if authentication was successful, False if user cancelled.
@@ -65,13 +99,15 @@ class KeyboardManager:
             This method will show error messages for incorrect passwords and
             allow the user to retry multiple times.
         """
+        if self.sudo.authenticate_cached():
+            return True
+
         dialog: PasswordDialog = PasswordDialog()
         while True:
             if dialog.exec() != QDialog.DialogCode.Accepted:
                 return False
 
             password: str = dialog.get_password()
-            print(f"Attempting to authenticate with password: {password}")
             if self.sudo.authenticate(password):
                 return True
 
@@ -83,16 +119,16 @@ class KeyboardManager:
         """
         Start the keyboard helper process with elevated privileges.
 
-        Launches the keyboard helper script using sudo privileges. The helper
-        process runs independently and communicates through temporary files.
-        Waits up to 2 seconds for the helper process to indicate it's running.
+        Opens the communication socket and launches the keyboard helper script
+        using sudo privileges, passing it the socket path. Waits up to 2 seconds
+        for the helper to connect, waking up as soon as it does.
 
         Returns:
             bool: True if the helper process started successfully, False otherwise.
 
         Note:
             If a helper process is already running, this method returns True
-            without starting a new process. If the helper fails to start within
+            without starting a new process. If the helper fails to connect within
             the timeout period, the process is terminated.
         """
         if self.helper_process is not None:
@@ -102,17 +138,31 @@ class KeyboardManager:
         helper_script: Path = Path(__file__).parent.parent / "utils/keyboard_helper.py"
         print(f"Starting keyboard helper from: {helper_script}")
 
+        # Listen before launching the helper so it can connect right away
+        self.socket_path.unlink(missing_ok=True)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.server.bind(str(self.socket_path))
+        self.server.listen(1)
+
         try:
-            # Start the helper process with sudo
-            self.helper_process = self.sudo.run_python_script(helper_script)
+            # Start the helper process with sudo. It shares our output streams,
+            # since nothing would read pipes and a full one would block it
+            self.helper_process = self.sudo.run_python_script(
+                helper_script, self.socket_path, stdout=None, stderr=None
+            )
         except (subprocess.CalledProcessError, RuntimeError):
             return False
 
-        # Wait for the helper to start
-        for _ in range(20):  # Wait up to 2 seconds
-            if self.running_file.exists():
-                return True
-            time.sleep(0.1)
+        # Wait for the helper to connect (up to 2 seconds)
+        ready, _, _ = select.select([self.server], [], [], 2.0)
+        if ready:
+            self.connection, _ = self.server.accept()
+            self.notifier = QSocketNotifier(
+                sip.voidptr(self.connection.fileno()), QSocketNotifier.Type.Read, self
+            )
+            self.notifier.setEnabled(False)
+            self.notifier.activated.connect(self.read_key_states)
+            return True
 
         # If we get here, the helper didn't start properly
         if self.helper_process:
@@ -127,16 +177,26 @@ class KeyboardManager:
         """
         Stop the helper process and clean up resources.
 
-        Removes the running indicator file to signal the helper process to stop,
-        then terminates the process if it's still running. Also cleans up the
-        process reference.
+        Closes the connection to signal the helper process to stop, then
+        terminates the process if it's still running. Also closes the listening
+        socket, removes its file and cleans up the process reference.
 
         Note:
             This method is safe to call multiple times and will not raise
             exceptions if the process is already stopped or files don't exist.
         """
-        if self.running_file.exists():
-            self.running_file.unlink()
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        self.monitoring = False
+        self.capturing = False
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+            self.socket_path.unlink(missing_ok=True)
         if self.helper_process:
             self.helper_process.terminate()
             self.helper_process = None
@@ -145,8 +205,8 @@ class KeyboardManager:
         """
         Send a command to the helper process.
 
-        Writes a JSON-encoded command to the command file for the helper process
-        to read and execute. Commands are structured as dictionaries with a 'type'
+        Sends a JSON-encoded command as a single packet over the helper
+        connection. Commands are structured as dictionaries with a 'type'
         field indicating the command type and additional parameters as needed.
 
         Args:
@@ -154,64 +214,98 @@ class KeyboardManager:
                 Must include a 'type' field specifying the command type.
 
         Returns:
-            bool: True if the command was written successfully, False otherwise.
+            bool: True if the command was sent successfully, False otherwise.
 
         Example:
             >>> manager.send_command({"type": "wait_key"})
             >>> manager.send_command({"type": "monitor", "scan_codes": [1, 2, 3]})
         """
+        if self.connection is None:
+            return False
         try:
-            with open(self.command_file, "w") as f:
-                json.dump(command, f)
+            self.connection.send(
+                json.dumps(command, separators=IPC_SEPARATORS).encode()
+            )
             return True
         except Exception as e:
             print(f"Error sending command: {e}")
             return False
 
-    def wait_for_key(self) -> Optional[Dict[str, Any]]:
+    def receive_message(self, timeout: Optional[float] = 0) -> Optional[Dict[str, Any]]:
         """
-        Wait for a single keypress and return its scan code and name.
+        Receive the next message sent by the helper process.
 
-        Sends a 'wait_key' command to the helper process and waits for a response
-        containing information about the pressed key. This is typically used for
-        key mapping or configuration purposes.
+        Args:
+            timeout (Optional[float]): Seconds to wait for a message. 0 returns
+                immediately and None waits indefinitely. Defaults to 0.
 
         Returns:
-            Optional[Dict[str, Any]]: Dictionary containing key information with
-                scan code and key name, or None if no key was pressed within
-                the timeout period or if an error occurred.
+            Optional[Dict[str, Any]]: The decoded message, or None if no message
+                arrived in time.
 
-        Note:
-            This method will wait up to 5 seconds for a key press. The response
-            file is automatically cleaned up after reading.
+        Raises:
+            ConnectionError: If the helper process closed the connection.
         """
-        if not self.send_command({"type": "wait_key"}):
+        if self.connection is None:
             return None
+        ready, _, _ = select.select([self.connection], [], [], timeout)
+        if not ready:
+            return None
+        data: bytes = self.connection.recv(MAX_MESSAGE_SIZE)
+        if not data:
+            raise ConnectionError("Keyboard helper closed the connection")
+        return json.loads(data)
 
-        # Wait for response
-        for _ in range(50):  # Wait up to 5 seconds
-            try:
-                if self.response_file.exists():
-                    with open(self.response_file, "r") as f:
-                        response: Dict[str, Any] = json.load(f)
-                    try:
-                        os.remove(self.response_file)
-                    except Exception:
-                        pass
-                    return response.get("key_info")
-            except Exception:
+    def capture_key(self) -> bool:
+        """
+        Start capturing the next key press without blocking.
+
+        Sends a 'wait_key' command to the helper process and returns right
+        away. The pressed key is published through the key_captured signal as
+        soon as the helper reports it.
+
+        Returns:
+            bool: True if the capture command was sent successfully,
+                False otherwise.
+
+        Note:
+            Messages that were already pending before the command was sent
+            are discarded, so only a key pressed from now on is reported.
+        """
+        try:
+            # Drop stale messages so only a key pressed from now on is reported
+            while self.receive_message() is not None:
                 pass
-            time.sleep(0.1)
-        return None
+        except (OSError, ConnectionError, json.JSONDecodeError) as e:
+            print(f"Error capturing key: {e}")
+            return False
+        if not self.send_command({"type": "wait_key"}):
+            return False
+        self.capturing = True
+        self._update_notifier()
+        return True
+
+    def cancel_capture(self) -> None:
+        """
+        Stop waiting for the key requested by capture_key().
+
+        A key reported by the helper afterwards is ignored.
+        """
+        self.capturing = False
+        self._update_notifier()
+
+    def _update_notifier(self) -> None:
+        """Enable the notifier only while monitoring or capturing keys."""
+        if self.notifier is not None:
+            self.notifier.setEnabled(self.monitoring or self.capturing)
 
     def start_monitoring(self, scan_codes: List[int]) -> bool:
         """
         Start monitoring the specified scan codes.
 
         Instructs the helper process to begin monitoring a specific set of keys
-        identified by their scan codes. The helper will continuously track the
-        state of these keys and make the information available through the
-        response file.
+        identified by their scan codes. The helper will send the scan code and
+        new state over the connection every time one of these keys changes.
 
         Args:
             scan_codes (List[int]): List of keyboard scan codes to monitor.
@@ -223,18 +317,22 @@ class KeyboardManager:
 
         Note:
             This method only sends the command; actual monitoring success
-            depends on the helper process. Use get_key_states() to retrieve
-            the current state of monitored keys.
+            depends on the helper process. Changes are published through the
+            state_changed signal.
         """
-        return self.send_command({"type": "monitor", "scan_codes": scan_codes})
+        self.key_states = {}
+        if not self.send_command({"type": "monitor", "scan_codes": scan_codes}):
+            return False
+        self.monitoring = True
+        self._update_notifier()
+        return True
 
     def stop_monitoring(self) -> bool:
         """
         Stop monitoring keys.
 
         Sends a command to the helper process to stop monitoring all keys.
-        After this command, get_key_states() will no longer return updated
-        key state information.
+        After this command, state_changed is no longer emitted.
 
         Returns:
             bool: True if the stop command was sent successfully, False otherwise.
@@ -243,29 +341,53 @@ class KeyboardManager:
             This method does not stop the helper process itself, only the
             key monitoring functionality. Use stop() to terminate the helper process.
         """
+        self.key_states = {}
+        self.monitoring = False
+        self._update_notifier()
         return self.send_command({"type": "stop_monitor"})
 
-    def get_key_states(self) -> Dict[Union[str, int], bool]:
+    def update_key_states(self) -> Dict[int, bool]:
         """
-        Get the current state of monitored keys.
+        Apply every key state change the helper has sent so far.
 
-        Reads the response file to get the current pressed/released state of
-        all keys that are being monitored. This method is typically called
-        repeatedly in a timer loop to get real-time key state updates.
+        Reads pending messages without blocking. Reports that don't change a
+        key's state, such as the repeated presses sent while a key is held
+        down, are ignored. A key reported while a capture is pending is
+        published through the key_captured signal. If the helper closed the
+        connection, the manager is stopped, so later commands report failure
+        instead of waiting on a helper that is gone.
 
         Returns:
-            Dict[Union[str, int], bool]: Dictionary mapping scan codes (as strings
-                or integers) to their current state (True for pressed, False for
-                released). Returns an empty dictionary if the response file doesn't
-                exist or contains invalid JSON.
-
-        Note:
-            The scan codes in the returned dictionary may be strings or integers
-            depending on how they were serialized by the helper process. Callers
-            should handle both types appropriately.
+            Dict[int, bool]: The scan codes whose state changed, mapped to
+                their new state.
         """
+        changed: Dict[int, bool] = {}
         try:
-            with open(self.response_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            while (message := self.receive_message()) is not None:
+                if "key_state" in message:
+                    scan_code, pressed = message["key_state"]
+                    if self.key_states.get(scan_code) != pressed:
+                        self.key_states[scan_code] = pressed
+                        changed[scan_code] = pressed
+                elif "key_info" in message and self.capturing:
+                    self.capturing = False
+                    self._update_notifier()
+                    self.key_captured.emit(message["key_info"])
+        except ConnectionError as e:
+            print(f"Error reading key states: {e}")
+            self.stop()
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error reading key states: {e}")
+        return changed
+
+    def read_key_states(self) -> None:
+        """
+        Read key state updates when the helper connection becomes readable.
+
+        Connected to the socket notifier while keys are monitored or captured.
+        Emits state_changed with only the keys whose state changed, if any
+        did.
+        """
+        changed: Dict[int, bool] = self.update_key_states()
+        if changed:
+            self.state_changed.emit(changed)
@@ -1,6 +1,6 @@
 from typing import List, Dict, Any, Optional, Tuple
 from PyQt6.QtWidgets import QWidget, QDialog
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal
 from PyQt6.QtGui import QResizeEvent, QMouseEvent
 from keyboard_visualizer.ui.components.keyboard_key import KeyboardKey
 from keyboard_visualizer.ui.dialogs.settings_dialog import KeyBindDialog
@@ -20,19 +20,41 @@ class KeyboardCanvas(QWidget):
     around. In visualizer mode, the canvas automatically scales keys to maintain
     aspect ratio when the window is resized.
 
+    Signals:
+        keys_changed: Emitted whenever keys are added to, removed from or
+            rebound on the canvas, so scan code lookups built from the keys
+            can be refreshed.
+
     Attributes:
         keyboard_manager (KeyboardManager): Manager for keyboard input monitoring.
         keys (List[KeyboardKey]): List of all keyboard keys on the canvas.
         editor_mode (bool): Whether the canvas is in editor mode (True) or visualizer mode (False).
         dragging (bool): Whether a drag operation is currently in progress.
-        drag_start (Optional[QPoint]): Starting position of the current drag operation.
+        drag_start (Optional[Tuple[int, int]]): Starting position of the current drag operation.
         drag_keys (List[KeyboardKey]): List of keys being dragged in the current operation.
-        key_initial_positions (Dict[KeyboardKey, QPoint]): Initial positions of keys being dragged.
+        key_initial_positions (List[Tuple[int, int]]): Initial positions of keys being dragged,
+            in the same order as drag_keys.
+        key_drag_sizes (List[Tuple[int, int]]): Sizes of keys being dragged, in the same
+            order as drag_keys.
         base_size (Optional[QSize]): Original canvas size used for scaling calculations.
-        key_original_sizes (Dict[KeyboardKey, QSize]): Original sizes of keys for scaling.
-        key_original_positions (Dict[KeyboardKey, QPoint]): Original positions of keys for scaling.
+        key_original_geometry (List[Tuple[int, int, int, int]]): Original (x, y, width,
+            height) of keys for scaling, in the same order as keys.
+        scale (Optional[Tuple[int, int]]): Scale factor currently applied to the keys,
+            as an integer (numerator, denominator) pair.
+        _scale_flush (QTimer): Zero-delay single-shot timer that rescales the keys
+            once the queued resize events have been handled.
+        _pending_drag_pos (Optional[Tuple[int, int]]): Latest drag position waiting
+            to be applied by the drag flush timer.
+        _drag_flush (QTimer): Zero-delay single-shot timer that moves the dragged
+            keys once the queued mouse events have been handled.
+        _keybind_dialog (Optional[KeyBindDialog]): Key binding dialog, created on
+            first use and reused for every new key.
+        _scan_code_index (Optional[Dict[int, KeyboardKey]]): Keys by scan code,
+            built on first use and dropped whenever the keys change.
     """
 
+    keys_changed = pyqtSignal()
+
     def __init__(
         self, keyboard_manager: KeyboardManager, parent: Optional[QWidget] = None
     ) -> None:
@@ -52,14 +74,61 @@ class KeyboardCanvas(QWidget):
 
         # For drag functionality
         self.dragging: bool = False
-        self.drag_start: Optional[QPoint] = None
+        self.drag_start: Optional[Tuple[int, int]] = None
         self.drag_keys: List[KeyboardKey] = []
-        self.key_initial_positions: Dict[KeyboardKey, QPoint] = {}
+        self.key_initial_positions: List[Tuple[int, int]] = []
+        self.key_drag_sizes: List[Tuple[int, int]] = []
+
+        # Coalesce drag moves into one pass over the keys per event loop pass
+        self._pending_drag_pos: Optional[Tuple[int, int]] = None
+        self._drag_flush: QTimer = QTimer(self)
+        self._drag_flush.setSingleShot(True)
+        self._drag_flush.setInterval(0)
+        self._drag_flush.timeout.connect(self._applyDrag)
 
         # For scaling functionality
         self.base_size: Optional[QSize] = None
-        self.key_original_sizes: Dict[KeyboardKey, QSize] = {}
-        self.key_original_positions: Dict[KeyboardKey, QPoint] = {}
+        self.key_original_geometry: List[Tuple[int, int, int, int]] = []
+        self.scale: Optional[Tuple[int, int]] = None
+
+        # Coalesce bursts of resize events into one rescale per event loop pass
+        self._scale_flush: QTimer = QTimer(self)
+        self._scale_flush.setSingleShot(True)
+        self._scale_flush.setInterval(0)
+        self._scale_flush.timeout.connect(self._applyScale)
+
+        # Created the first time a key is added
+        self._keybind_dialog: Optional[KeyBindDialog] = None
+
+        # Built from the keys on first lookup, see scanCodeIndex()
+        self._scan_code_index: Optional[Dict[int, KeyboardKey]] = None
+
+    def scanCodeIndex(self) -> Dict[int, KeyboardKey]:
+        """
+        Get the canvas's keys indexed by scan code.
+
+        The index is built on first use and kept until the keys change, so
+        repeated lookups don't rescan the key list. Keys without a scan code
+        are left out.
+
+        Returns:
+            Dict[int, KeyboardKey]: Mapping of scan codes to their keys.
+        """
+        if self._scan_code_index is None:
+            self._scan_code_index = {
+                key.scan_code: key for key in self.keys if key.scan_code is not None
+            }
+        return self._scan_code_index
+
+    def notifyKeysChanged(self) -> None:
+        """
+        Drop the scan code index and emit keys_changed.
+
+        Must be called after keys are added, removed or rebound, so the next
+        scanCodeIndex() call reflects the current keys.
+        """
+        self._scan_code_index = None
+        self.keys_changed.emit()
 
     def saveOriginalLayout(self) -> None:
         """
@@ -67,20 +136,24 @@ class KeyboardCanvas(QWidget):
 
         Stores the current canvas size and all key positions and sizes as reference
         points for proportional scaling when the canvas is resized in visualizer mode.
-        This method should be called before entering visualizer mode.
+        Positions and sizes are kept as plain integers so scaling them is simple
+        arithmetic. This method should be called before entering visualizer mode.
         """
-        if not self.base_size:
+        if self.base_size is None:
             self.base_size = self.size()
-            self.key_original_sizes = {key: key.size() for key in self.keys}
-            self.key_original_positions = {key: key.pos() for key in self.keys}
+            # The keys start out unscaled, i.e. at a scale of one
+            area: int = self.base_size.width() * self.base_size.height()
+            self.scale = (area, area)
+            self.key_original_geometry = [key.geometry().getRect() for key in self.keys]
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
         Handle canvas resize events with proportional key scaling.
 
-        In visualizer mode, automatically scales all keys proportionally to maintain
-        the visual layout when the canvas is resized. Uses the smaller of width or
-        height scale factors to preserve aspect ratios.
+        In visualizer mode, schedules a proportional rescale of all keys so the
+        visual layout is maintained when the canvas is resized. The rescale runs
+        once the pending events have been handled, so a burst of resize events
+        while the window is being dragged results in a single rescale.
 
         Args:
             event (QResizeEvent): The resize event containing old and new sizes.
@@ -92,28 +165,53 @@ class KeyboardCanvas(QWidget):
         super().resizeEvent(event)
 
         if not self.editor_mode and self.keys:
-            if not self.base_size:
-                self.saveOriginalLayout()
+            self._scale_flush.start()
 
-            # Calculate scale factors
-            width_scale: float = event.size().width() / self.base_size.width()
-            height_scale: float = event.size().height() / self.base_size.height()
+    def _applyScale(self) -> None:
+        """
+        Scale all keys to the current canvas size.
 
-            # Use the smaller scale to maintain aspect ratio
-            scale: float = min(width_scale, height_scale)
+        Uses the smaller of width or height scale factors to preserve aspect
+        ratios. Resizes that leave the scale factor unchanged, such as growing
+        the window along its unconstrained side or returning to the size the
+        layout was saved at while unscaled, don't touch the keys at all.
+        Updates are disabled while the keys are moved so the canvas is
+        repainted once.
 
-            for key in self.keys:
-                # Scale size
-                original_size = self.key_original_sizes[key]
-                new_width: int = int(original_size.width() * scale)
-                new_height: int = int(original_size.height() * scale)
-                key.setFixedSize(new_width, new_height)
+        Note:
+            The scale factor is kept as an exact integer fraction, so every
+            key coordinate is scaled with integer arithmetic only.
+        """
+        if self.editor_mode or not self.keys:
+            return
+        if self.base_size is None:
+            self.saveOriginalLayout()
 
-                # Scale position
-                original_pos = self.key_original_positions[key]
-                new_x: int = int(original_pos.x() * scale)
-                new_y: int = int(original_pos.y() * scale)
-                key.move(new_x, new_y)
+        # Calculate both scale factors over a common denominator
+        base_width: int = self.base_size.width()
+        base_height: int = self.base_size.height()
+        width_scale: int = self.width() * base_height
+        height_scale: int = self.height() * base_width
+
+        # Use the smaller scale to maintain aspect ratio
+        scale: Tuple[int, int] = (
+            min(width_scale, height_scale),
+            base_width * base_height,
+        )
+        if scale == self.scale:
+            return
+        self.scale = scale
+        num, den = scale
+
+        self.setUpdatesEnabled(False)
+        try:
+            for key, (x, y, width, height) in zip(
+                self.keys, self.key_original_geometry
+            ):
+                key.setFixedSize(width * num // den, height * num // den)
+                key.move(x * num // den, y * num // den)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def toggleEditorMode(self, enabled: bool) -> None:
         """
@@ -135,13 +233,15 @@ class KeyboardCanvas(QWidget):
         self.editor_mode = enabled
         if enabled:
             # Reset to original sizes and positions when entering editor mode
-            if self.base_size:
-                for key in self.keys:
-                    key.setFixedSize(self.key_original_sizes[key])
-                    key.move(self.key_original_positions[key])
+            if self.base_size is not None:
+                for key, (x, y, width, height) in zip(
+                    self.keys, self.key_original_geometry
+                ):
+                    key.setFixedSize(width, height)
+                    key.move(x, y)
                 self.base_size = None
-                self.key_original_sizes.clear()
-                self.key_original_positions.clear()
+                self.scale = None
+                self.key_original_geometry.clear()
         else:
             # Save original layout when entering visualization mode
             self.saveOriginalLayout()
@@ -167,22 +267,27 @@ class KeyboardCanvas(QWidget):
                 self.clearSelection()
 
             # Create new key at click position
-            dialog: KeyBindDialog = KeyBindDialog(self.keyboard_manager, self)
-            if dialog.exec() == QDialog.DialogCode.Accepted and dialog.key_info:
-                key: KeyboardKey = KeyboardKey(
+            if self._keybind_dialog is None:
+                self._keybind_dialog = KeyBindDialog(self.keyboard_manager, self)
+            dialog: KeyBindDialog = self._keybind_dialog
+            if (
+                dialog.reset()
+                and dialog.exec() == QDialog.DialogCode.Accepted
+                and dialog.key_info
+            ):
+                key: KeyboardKey = KeyboardKey.acquire(
                     dialog.key_info["name"],
                     dialog.key_info["name"],
                     None,  # Don't pass keyboard_manager to key
                     self,
                 )
                 key.scan_code = dialog.key_info["scan_code"]
-                pos: QPoint = event.pos()
-                pos.setX(pos.x() - key.width() // 2)
-                pos.setY(pos.y() - key.height() // 2)
-                key.move(pos)
-                key.setParent(self)  # Ensure parent is set
+                pos: QPoint = event.position().toPoint()
+                key.move(pos.x() - key.width() // 2, pos.y() - key.height() // 2)
+                key.rebound.connect(self.notifyKeysChanged)
                 self.keys.append(key)
                 key.show()
+                self.notifyKeysChanged()
 
     def clearSelection(self) -> None:
         """
@@ -191,98 +296,161 @@ class KeyboardCanvas(QWidget):
         Sets the selected state of all keys to False and triggers a visual update
         to reflect the deselection. This is typically called when starting a new
         selection or when clearing all selections.
+
+        Note:
+            Only keys that were actually selected are repainted, so clearing an
+            empty or small selection doesn't queue a paint event for every key.
         """
         for key in self.keys:
-            key.selected = False
-            key.update()
+            if key.selected:
+                key.selected = False
+                key.update()
 
-    def startDrag(self, offset: QPoint) -> None:
+    def startDrag(self, pos: QPoint) -> None:
         """
         Start a drag operation for selected keys.
 
         Initializes the drag state by recording the starting position and identifying
         which keys are currently selected for dragging. Stores the initial position
-        of each selected key for relative movement calculations.
+        and size of each selected key as plain integers, so that moving the keys
+        doesn't have to query them again on every mouse move.
 
         Args:
-            offset (QPoint): The offset from the key's origin to the drag start point.
-                This parameter is currently unused but maintained for API compatibility.
+            pos (QPoint): The mouse position where the drag started, in canvas
+                coordinates.
         """
         self.dragging = True
-        self.drag_start = self.mapFromGlobal(self.cursor().pos())
+        self.drag_start = (pos.x(), pos.y())
         self.drag_keys = [key for key in self.keys if key.selected]
-        self.key_initial_positions = {key: key.pos() for key in self.drag_keys}
+        self.key_initial_positions = [(key.x(), key.y()) for key in self.drag_keys]
+        self.key_drag_sizes = [(key.width(), key.height()) for key in self.drag_keys]
 
     def updateDragPosition(self, pos: QPoint, source_key: KeyboardKey) -> None:
         """
         Update positions of keys during a drag operation.
 
-        Calculates the movement delta from the drag start position and applies it
-        to all selected keys. Ensures keys remain within the canvas boundaries
-        by clamping their positions.
+        Records the latest mouse position and schedules the selected keys to be
+        moved once the queued mouse events have been handled, so a burst of
+        mouse moves results in a single pass over the keys and a single repaint.
 
         Args:
-            pos (QPoint): The current mouse position (currently unused).
+            pos (QPoint): The current mouse position, in canvas coordinates.
             source_key (KeyboardKey): The key that initiated the drag (currently unused).
 
         Note:
-            The pos and source_key parameters are maintained for API compatibility
-            but the actual position is calculated from the global cursor position.
+            The position is taken from the mouse event rather than by querying
+            the global cursor position, which saves a round trip to the window
+            system on every mouse move.
         """
         if not self.dragging or not self.drag_keys:
             return
 
-        current_pos: QPoint = self.mapFromGlobal(self.cursor().pos())
-        delta: QPoint = current_pos - self.drag_start
+        self._pending_drag_pos = (pos.x(), pos.y())
+        self._drag_flush.start()
+
+    def _applyDrag(self) -> None:
+        """
+        Move the dragged keys to the most recent drag position.
+
+        Calculates the movement delta from the drag start position and applies it
+        to all selected keys. Ensures keys remain within the canvas boundaries
+        by clamping their positions. Does nothing if no move is pending.
+        """
+        if self._pending_drag_pos is None or self.drag_start is None:
+            return
+        pos_x, pos_y = self._pending_drag_pos
+        self._pending_drag_pos = None
+
+        start_x, start_y = self.drag_start
+        dx: int = pos_x - start_x
+        dy: int = pos_y - start_y
+        canvas_width: int = self.width()
+        canvas_height: int = self.height()
 
         # Move all selected keys
-        for key in self.drag_keys:
-            new_pos: QPoint = self.key_initial_positions[key] + delta
-            # Keep the key within the canvas bounds
-            new_pos.setX(max(0, min(new_pos.x(), self.width() - key.width())))
-            new_pos.setY(max(0, min(new_pos.y(), self.height() - key.height())))
-            key.move(new_pos)
+        for key, (x, y), (width, height) in zip(
+            self.drag_keys, self.key_initial_positions, self.key_drag_sizes
+        ):
+            # Keep the key within the canvas bounds, using conditional
+            # expressions rather than min/max calls on this hot path
+            x += dx
+            y += dy
+            max_x: int = canvas_width - width
+            max_y: int = canvas_height - height
+            x = max_x if x > max_x else x
+            y = max_y if y > max_y else y
+            key.move(0 if x < 0 else x, 0 if y < 0 else y)
 
     def endDrag(self) -> None:
         """
         End the current drag operation and clean up drag state.
 
-        Resets all drag-related flags and clears temporary storage used during
-        the drag operation. This method should be called when the drag operation
-        is completed or cancelled.
+        Applies any drag move that is still pending, then resets all drag-related
+        flags and clears temporary storage used during the drag operation. This
+        method should be called when the drag operation is completed or cancelled.
         """
+        self._applyDrag()
         self.dragging = False
         self.drag_keys = []
         self.key_initial_positions.clear()
+        self.key_drag_sizes.clear()
 
     def removeKey(self, key: KeyboardKey) -> None:
         """
         Remove a key from the canvas.
 
-        Removes the specified key from the keys list, clears its parent relationship,
-        and schedules it for deletion. This method safely handles cleanup to prevent
-        memory leaks and orphaned widgets.
+        Removes the specified key from the keys list and releases it, which
+        detaches it from the canvas and keeps the widget for reuse by the next
+        key that is created.
 
         Args:
             key (KeyboardKey): The key to remove from the canvas.
+
+        Note:
+            The key list is scanned once: the index lookup doubles as the
+            membership check, and the same index removes the key's scaling data.
         """
-        if key in self.keys:
-            self.keys.remove(key)
-            key.setParent(None)  # Clear parent before deletion
-            key.deleteLater()
+        try:
+            index: int = self.keys.index(key)
+        except ValueError:
+            return
+        del self.keys[index]
+        if self.base_size is not None:
+            del self.key_original_geometry[index]
+        key.release()
+        self.notifyKeysChanged()
 
     def clearKeys(self) -> None:
         """
         Remove all keys from the canvas.
 
-        Clears all keys from the canvas by removing their parent relationships
-        and scheduling them for deletion. This method is typically used when
-        loading a new layout or resetting the canvas.
+        Clears all keys from the canvas by releasing them, so the widgets are
+        reused by the next layout instead of being destroyed and rebuilt. This
+        method is typically used when loading a new layout or resetting the
+        canvas.
+
+        Note:
+            Updates are disabled while the keys are removed, so the canvas is
+            repainted once rather than once per key. If updates are already
+            disabled by the caller, they are left that way.
         """
+        if not self.keys:
+            return
+        updates_enabled: bool = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._releaseKeys()
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+        self.notifyKeysChanged()
+
+    def _releaseKeys(self) -> None:
+        """Release every key and forget its scaling data, without notifying."""
         for key in self.keys:
-            key.setParent(None)  # Clear parent before deletion
-            key.deleteLater()
+            key.release()
         self.keys.clear()
+        self.key_original_geometry.clear()
 
     def getConfiguration(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -296,21 +464,26 @@ class KeyboardCanvas(QWidget):
             Dict[str, List[Dict[str, Any]]]: Configuration dictionary containing
                 a 'keys' list with each key's properties including label, key_bind,
                 scan_code, position (x, y) and dimensions (width, height).
+
+        Note:
+            Each key's position and size are read with a single geometry() call
+            rather than four separate Qt calls.
         """
-        return {
-            "keys": [
+        keys: List[Dict[str, Any]] = []
+        for key in self.keys:
+            x, y, width, height = key.geometry().getRect()
+            keys.append(
                 {
                     "label": key.label,
                     "key_bind": key.key_bind,
                     "scan_code": key.scan_code,
-                    "x": key.x(),
-                    "y": key.y(),
-                    "width": key.width(),
-                    "height": key.height(),
+                    "x": x,
+                    "y": y,
+                    "width": width,
+                    "height": height,
                 }
-                for key in self.keys
-            ]
-        }
+            )
+        return {"keys": keys}
 
     def loadConfiguration(self, config: Dict[str, List[Dict[str, Any]]]) -> None:
         """
@@ -328,17 +501,24 @@ class KeyboardCanvas(QWidget):
         Note:
             This method will clear all existing keys before loading the new configuration.
             Missing key_bind or scan_code values will default to empty string or None.
+            Updates are disabled while the keys are created, so the canvas is
+            repainted once for the whole layout.
         """
-        self.clearKeys()
-        for key_data in config["keys"]:
-            key: KeyboardKey = KeyboardKey(
-                key_data["label"],
-                key_data.get("key_bind", ""),
-                key_data.get("scan_code"),  # Pass scan_code directly
-                self,  # Pass parent
-            )
-            key.setFixedSize(key_data["width"], key_data["height"])
-            key.move(key_data["x"], key_data["y"])
-            key.setParent(self)  # Ensure parent is set
-            self.keys.append(key)
-            key.show()
+        self.setUpdatesEnabled(False)
+        try:
+            self._releaseKeys()
+            for key_data in config["keys"]:
+                key: KeyboardKey = KeyboardKey.acquire(
+                    key_data["label"],
+                    key_data.get("key_bind", ""),
+                    key_data.get("scan_code"),  # Pass scan_code directly
+                    self,  # Pass parent
+                )
+                key.setFixedSize(key_data["width"], key_data["height"])
+                key.move(key_data["x"], key_data["y"])
+                key.rebound.connect(self.notifyKeysChanged)
+                self.keys.append(key)
+                key.show()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.notifyKeysChanged()
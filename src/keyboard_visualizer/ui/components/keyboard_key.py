@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QWidget, QInputDialog, QDialog
-from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtCore import Qt, QPoint, QTimer, QEvent, pyqtSignal
 from PyQt6.QtGui import (
     QPainter,
     QColor,
@@ -8,18 +8,43 @@ from PyQt6.QtGui import (
     QRadialGradient,
     QPaintEvent,
     QMouseEvent,
+    QPixmap,
+    QFont,
 )
 from PyQt6.QtMultimedia import QSoundEffect
 from PyQt6.QtCore import QUrl
 from pathlib import Path
-from typing import Optional
-import json
+from typing import Optional, Tuple, Dict, Iterable, List
 import random
 
 from keyboard_visualizer.ui.dialogs.settings_dialog import KeyBindDialog
 from keyboard_visualizer.utils.config import load_key_colors
 
-KEY_COLORS = load_key_colors()
+# Parse the configured colors once instead of on every render
+KEY_COLORS: Dict[str, QColor] = {
+    name: QColor(color) for name, color in load_key_colors().items()
+}
+
+# Resize handle identifiers, as bit flags so sides can be tested with a mask
+HANDLE_NONE = 0
+HANDLE_TOP_LEFT = 1
+HANDLE_TOP_RIGHT = 2
+HANDLE_BOTTOM_LEFT = 4
+HANDLE_BOTTOM_RIGHT = 8
+HANDLE_LEFT = HANDLE_TOP_LEFT | HANDLE_BOTTOM_LEFT
+HANDLE_RIGHT = HANDLE_TOP_RIGHT | HANDLE_BOTTOM_RIGHT
+HANDLE_TOP = HANDLE_TOP_LEFT | HANDLE_TOP_RIGHT
+HANDLE_BOTTOM = HANDLE_BOTTOM_LEFT | HANDLE_BOTTOM_RIGHT
+# Handles whose resize cursor points from top-left to bottom-right
+HANDLE_FDIAG = HANDLE_TOP_LEFT | HANDLE_BOTTOM_RIGHT
+
+SOUNDS_DIR = Path(__file__).parent.parent.parent / "assets/sounds/keys"
+# Sound effects shared by every key, keyed by sound file path
+SOUND_EFFECTS: Dict[str, QSoundEffect] = {}
+# Sound file each key binding resolved to, so fallbacks are only chosen once
+SOUND_PATHS: Dict[str, Path] = {}
+# Letters whose sounds stand in for key bindings without a sound of their own
+FALLBACK_LETTERS: Tuple[str, ...] = tuple("abcdefghijklmnopqrstuvwxyz")
 
 
 class KeyboardKey(QWidget):
@@ -37,6 +62,9 @@ class KeyboardKey(QWidget):
     - Pressed state visualization with glow effects
     - Selection state for multi-key operations
 
+    Signals:
+        rebound: Emitted when the key binding and scan code are edited.
+
     Attributes:
         label (str): The display text shown on the key.
         key_bind (str): The key binding identifier.
@@ -45,12 +73,38 @@ class KeyboardKey(QWidget):
         selected (bool): Whether the key is selected in editor mode.
         dragging (bool): Whether the key is currently being dragged.
         resizing (bool): Whether the key is currently being resized.
-        resize_handle (Optional[str]): Which resize handle is being used.
+        resize_handle (int): Which resize handle is being used, as one of the
+            HANDLE_* flags, or HANDLE_NONE when not resizing.
         offset (QPoint): Mouse offset for drag/resize operations.
         min_size (int): Minimum size constraint for the key.
-        sound_effect (QSoundEffect): Audio effect played when key is pressed.
+        sound_effect (Optional[QSoundEffect]): Audio effect played when key is
+            pressed, shared with other keys that use the same sound. Resolved
+            from key_bind the first time the key is pressed.
+        _canvas (Optional[QWidget]): The parent canvas, kept up to date on
+            reparenting so event handlers don't have to query Qt for it.
+        _pending_geometry (Optional[Tuple[int, int, int, int]]): Geometry (x, y,
+            width, height) waiting to be applied by the geometry flush timer.
+        _geometry_flush (QTimer): Zero-delay single-shot timer that applies the
+            latest pending geometry once the queued mouse events are handled.
+        _face_cache (Dict[Tuple[bool, bool, bool], QPixmap]): Rendered key faces
+            keyed by (pressed, selected, editor mode).
+        _face_key (Optional[Tuple[int, int, float, str]]): Width, height, device
+            pixel ratio and label the cached faces were rendered for.
+        _label_layout (Optional[Tuple[QFont, float, float]]): Font and unpressed
+            text position of the label, shared by the renders of every state.
+        _pool (List[KeyboardKey]): Class-wide list of released keys, reused by
+            acquire() instead of constructing new widgets.
+        _live (int): Class-wide number of keys in use, i.e. not in the pool.
+        _pool_limit (int): Class-wide cap on the pool size, the largest number
+            of keys that have been in use at once.
     """
 
+    rebound = pyqtSignal()
+
+    _pool: List["KeyboardKey"] = []
+    _live: int = 0
+    _pool_limit: int = 0
+
     def __init__(
         self,
         label: str = "",
@@ -68,6 +122,7 @@ class KeyboardKey(QWidget):
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
         super().__init__(parent)
+        self._canvas: Optional[QWidget] = parent
         self.label: str = label
         self.key_bind: str = key_bind
         self.scan_code: Optional[int] = scan_code
@@ -77,12 +132,167 @@ class KeyboardKey(QWidget):
 
         self.dragging: bool = False
         self.resizing: bool = False
-        self.resize_handle: Optional[str] = None
+        self.resize_handle: int = HANDLE_NONE
         self.offset: QPoint = QPoint()
         self.min_size: int = 30
 
+        # Coalesce interactive moves and resizes into one geometry change per
+        # event loop pass
+        self._pending_geometry: Optional[Tuple[int, int, int, int]] = None
+        self._geometry_flush: QTimer = QTimer(self)
+        self._geometry_flush.setSingleShot(True)
+        self._geometry_flush.setInterval(0)
+        self._geometry_flush.timeout.connect(self._flushGeometry)
+
+        # Rendered faces, reused until the size or label changes
+        self._face_cache: Dict[Tuple[bool, bool, bool], QPixmap] = {}
+        self._face_key: Optional[Tuple[int, int, float, str]] = None
+        self._label_layout: Optional[Tuple[QFont, float, float]] = None
+
         self.setMouseTracking(True)
-        self.sound_effect: QSoundEffect = self.setSoundEffect(key_bind)
+        self.sound_effect: Optional[QSoundEffect] = None
+        KeyboardKey._countLive(1)
+
+    @staticmethod
+    def _countLive(delta: int) -> None:
+        """Adjust the number of keys in use, raising the pool cap to the peak."""
+        KeyboardKey._live += delta
+        if KeyboardKey._live > KeyboardKey._pool_limit:
+            KeyboardKey._pool_limit = KeyboardKey._live
+
+    @classmethod
+    def acquire(
+        cls,
+        label: str = "",
+        key_bind: str = "",
+        scan_code: Optional[int] = None,
+        parent: Optional[QWidget] = None,
+    ) -> "KeyboardKey":
+        """
+        Get a key widget, reusing a released one when available.
+
+        Args:
+            label (str, optional): Display text for the key. Defaults to "".
+            key_bind (str, optional): Key binding identifier. Defaults to "".
+            scan_code (Optional[int], optional): Scan code for keyboard monitoring. Defaults to None.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+
+        Returns:
+            KeyboardKey: A key in the same state as a newly constructed one.
+        """
+        if not cls._pool:
+            return cls(label, key_bind, scan_code, parent)
+        key = cls._pool.pop()
+        KeyboardKey._countLive(1)
+        key.reset(label, key_bind, scan_code, parent)
+        return key
+
+    def release(self) -> None:
+        """
+        Hide the key and keep it for reuse by acquire().
+
+        The key is detached from its canvas and its rebound listeners, and
+        dropped out of any press, selection or drag state, so it no longer
+        reacts to anything. Once the pool holds as many keys as have ever been
+        in use at once, further released keys are deleted instead. Either way
+        the key must not be used again by the caller.
+        """
+        self.hide()
+        self._geometry_flush.stop()
+        try:
+            self.rebound.disconnect()
+        except TypeError:
+            pass  # Nothing was connected
+        self.setParent(None)
+
+        self.pressed = False
+        self.selected = False
+        self.dragging = False
+        self.resizing = False
+        self.resize_handle = HANDLE_NONE
+        self._pending_geometry = None
+        self.sound_effect = None
+
+        KeyboardKey._countLive(-1)
+        if len(KeyboardKey._pool) < KeyboardKey._pool_limit:
+            KeyboardKey._pool.append(self)
+        else:
+            self.deleteLater()
+
+    def reset(
+        self,
+        label: str = "",
+        key_bind: str = "",
+        scan_code: Optional[int] = None,
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        """
+        Return a released key to the state of a newly constructed one.
+
+        Args:
+            label (str, optional): Display text for the key. Defaults to "".
+            key_bind (str, optional): Key binding identifier. Defaults to "".
+            scan_code (Optional[int], optional): Scan code for keyboard monitoring. Defaults to None.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        """
+        self.setParent(parent)
+        self.label = label
+        self.key_bind = key_bind
+        self.scan_code = scan_code
+        self.pressed = False
+        self.selected = False
+        self.setFixedSize(40, 40)
+
+        self.dragging = False
+        self.resizing = False
+        self.resize_handle = HANDLE_NONE
+        self.offset = QPoint()
+        self._pending_geometry = None
+
+        self._face_cache.clear()
+        self._face_key = None
+        self._label_layout = None
+
+        self.setCursor(Qt.CursorShape.ArrowCursor)
+        self.sound_effect = None
+
+    @staticmethod
+    def loadSound(sound_path: Path) -> QSoundEffect:
+        """
+        Get the shared sound effect for a sound file, loading it if needed.
+
+        Args:
+            sound_path (Path): Path of the sound file.
+
+        Returns:
+            QSoundEffect: The sound effect shared by every key using this file.
+        """
+        path = str(sound_path)
+        sound_effect = SOUND_EFFECTS.get(path)
+        if sound_effect is None:
+            sound_effect = QSoundEffect()
+            sound_effect.setSource(QUrl.fromLocalFile(path))
+            sound_effect.setVolume(0.3)
+            SOUND_EFFECTS[path] = sound_effect
+        return sound_effect
+
+    @staticmethod
+    def preloadSounds(keys: Iterable["KeyboardKey"]) -> None:
+        """
+        Start loading the sounds of the given keys ahead of time.
+
+        QSoundEffect loads its source asynchronously, and keys only look up
+        their sound the first time they are pressed, so a sound that is not
+        loaded yet would make that press silent. Resolving the sounds of the
+        keys about to be visualized gives them time to load, without loading
+        sounds the layout never uses.
+
+        Args:
+            keys (Iterable[KeyboardKey]): Keys whose sounds should be loaded.
+        """
+        for key in keys:
+            if key.sound_effect is None:
+                key.setSoundEffect(key.key_bind)
 
     def setSoundEffect(self, key_bind: str) -> QSoundEffect:
         """
@@ -92,39 +302,84 @@ class KeyboardKey(QWidget):
         sound doesn't exist, falls back to a random letter sound, and finally
         to the 'a' key sound as a last resort.
 
+        Keys that resolve to the same sound file share one QSoundEffect, so
+        each sound is loaded once no matter how many keys use it. The file a
+        key binding resolves to is remembered, so later keys with the same
+        binding skip the lookup and share its fallback sound.
+
         Args:
             key_bind (str): The key binding identifier to find a sound for.
 
         Returns:
             QSoundEffect: Configured sound effect object ready for playback.
         """
-        sound_path = (
-            Path(__file__).parent.parent.parent
-            / "assets/sounds/keys"
-            / f"{key_bind}.wav"
-        )
-        if not sound_path.exists():
-            # choose random letter of the alphabet to replace the sound
-            choice = random.choice("abcdefghijklmnopqrstuvwxyz")
-            sound_path = (
-                Path(__file__).parent.parent.parent
-                / "assets/sounds/keys"
-                / f"{choice}.wav"
-            )
-            if not sound_path.exists():
-                # default to the sound of a if the chosen sound also does not exist
-                sound_path = (
-                    Path(__file__).parent.parent.parent / "assets/sounds/keys" / "a.wav"
-                )
-        self.sound_effect = QSoundEffect()
-        self.sound_effect.setSource(QUrl.fromLocalFile(str(sound_path)))
-        self.sound_effect.setVolume(0.3)
+        sound_path = SOUND_PATHS.get(key_bind)
+        if sound_path is None:
+            sound_path = SOUNDS_DIR / f"{key_bind}.wav"
+            # Preloaded sounds are known to exist without touching the filesystem
+            if str(sound_path) not in SOUND_EFFECTS and not sound_path.exists():
+                # choose random letter of the alphabet to replace the sound
+                choice = random.choice(FALLBACK_LETTERS)
+                sound_path = SOUNDS_DIR / f"{choice}.wav"
+                if str(sound_path) not in SOUND_EFFECTS and not sound_path.exists():
+                    # default to the sound of a if the chosen sound also does not exist
+                    sound_path = SOUNDS_DIR / "a.wav"
+            SOUND_PATHS[key_bind] = sound_path
+
+        self.sound_effect = self.loadSound(sound_path)
         return self.sound_effect
 
+    def changeEvent(self, event: Optional[QEvent]) -> None:
+        """
+        Keep the cached parent canvas in sync when the key is reparented.
+
+        Args:
+            event (Optional[QEvent]): The state change event.
+        """
+        if event is not None and event.type() == QEvent.Type.ParentChange:
+            self._canvas = self.parentWidget()
+        super().changeEvent(event)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """
         Paint the key widget with appropriate visual styling.
 
+        The key face is rendered into a pixmap by renderFace() and cached per
+        visual state (pressed, selected, editor mode), so repaints are a single
+        blit of the dirty rectangle. The cache is dropped whenever the key's
+        size, device pixel ratio or label changes.
+
+        Args:
+            event (QPaintEvent): The paint event holding the dirty rectangle.
+        """
+        dirty = event.rect()
+        if dirty.isEmpty() or not self.isVisible():
+            return
+
+        parent = self._canvas
+        if parent is None:
+            return
+
+        face_key = (self.width(), self.height(), self.devicePixelRatioF(), self.label)
+        if face_key != self._face_key:
+            self._face_cache.clear()
+            self._label_layout = None
+            self._face_key = face_key
+
+        state = (self.pressed, self.selected, parent.editor_mode)
+        face = self._face_cache.get(state)
+        if face is None:
+            face = self.renderFace(parent.editor_mode)
+            self._face_cache[state] = face
+
+        painter = QPainter(self)
+        painter.setClipRect(dirty)
+        painter.drawPixmap(0, 0, face)
+
+    def renderFace(self, editor_mode: bool) -> QPixmap:
+        """
+        Render the key in its current state into a pixmap.
+
         Handles rendering of:
         - Key face with rounded corners and appropriate colors
         - Pressed state with radial glow effect
@@ -136,29 +391,29 @@ class KeyboardKey(QWidget):
         and scales appropriately with key size changes.
 
         Args:
-            event (QPaintEvent): The paint event (unused but required by Qt).
+            editor_mode (bool): Whether the parent canvas is in editor mode.
+
+        Returns:
+            QPixmap: The rendered key, at the widget's device pixel ratio.
         """
-        parent = self.parent()
-        if parent is None:
-            return
+        ratio = self.devicePixelRatioF()
+        face = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        face.setDevicePixelRatio(ratio)
+        face.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(self)
+        painter = QPainter(face)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         if self.pressed:
-            color = QColor(KEY_COLORS["pressed"])
+            color = KEY_COLORS["pressed"]
             glow = QRadialGradient(
                 self.width() / 2, self.height() / 2, self.width() / 2
             )
-            glow.setColorAt(0, QColor(KEY_COLORS["glow_center"]))
-            glow.setColorAt(1, QColor(KEY_COLORS["glow_edge"]))
+            glow.setColorAt(0, KEY_COLORS["glow_center"])
+            glow.setColorAt(1, KEY_COLORS["glow_edge"])
             painter.fillRect(0, 0, self.width(), self.height(), glow)
         else:
-            color = (
-                QColor(KEY_COLORS["selected"])
-                if self.selected
-                else QColor(KEY_COLORS["normal"])
-            )
+            color = KEY_COLORS["selected"] if self.selected else KEY_COLORS["normal"]
 
         main_face = QPainterPath()
         main_face.addRoundedRect(1, 1, self.width() - 2, self.height() - 2, 5, 5)
@@ -169,69 +424,71 @@ class KeyboardKey(QWidget):
             highlight_path.moveTo(2, 2)
             highlight_path.lineTo(self.width() - 2, 2)
             pen = QPen(
-                QColor(
-                    KEY_COLORS["highlight_selected"]
-                    if self.selected
-                    else KEY_COLORS["highlight_normal"]
-                )
+                KEY_COLORS["highlight_selected"]
+                if self.selected
+                else KEY_COLORS["highlight_normal"]
             )
             pen.setWidth(1)
             painter.strokePath(highlight_path, pen)
 
         painter.setPen(
             QPen(
-                QColor(
-                    KEY_COLORS["text_normal"]
-                    if not self.pressed
-                    else KEY_COLORS["text_pressed"]
-                )
+                KEY_COLORS["text_normal"]
+                if not self.pressed
+                else KEY_COLORS["text_pressed"]
             )
         )
-        font = painter.font()
-        # Scale font size based on key size
-        base_size = 40  # Original key size
-        scale_factor = min(self.width() / base_size, self.height() / base_size)
-        font_size = max(6, int(9 * scale_factor))  # Minimum font size of 6
-        font.setPointSize(font_size)
-        font.setFamily("Arial")
-        font.setBold(True)
+        if self._label_layout is None:
+            font = painter.font()
+            # Scale font size based on key size
+            base_size = 40  # Original key size
+            scale_factor = min(self.width() / base_size, self.height() / base_size)
+            font_size = max(6, int(9 * scale_factor))  # Minimum font size of 6
+            font.setPointSize(font_size)
+            font.setFamily("Arial")
+            font.setBold(True)
+            painter.setFont(font)
+
+            text_rect = painter.fontMetrics().boundingRect(self.label)
+            self._label_layout = (
+                font,
+                (self.width() - text_rect.width()) / 2,
+                (self.height() + text_rect.height()) / 2,
+            )
+        font, x, y = self._label_layout
         painter.setFont(font)
 
-        text_rect = painter.fontMetrics().boundingRect(self.label)
-        x = (self.width() - text_rect.width()) / 2
-        y = (self.height() + text_rect.height()) / 2
-
         if self.pressed:
             x += 2
             y += 2
-
-        if not self.pressed:
-            painter.setPen(QPen(QColor(KEY_COLORS["text_shadow"])))
+        elif font.pointSize() > 8:
+            # At smaller sizes the 1px shadow is hidden under the label itself
+            painter.setPen(QPen(KEY_COLORS["text_shadow"]))
             painter.drawText(int(x + 1), int(y + 1), self.label)
-            painter.setPen(QPen(QColor(KEY_COLORS["text_normal"])))
+            painter.setPen(QPen(KEY_COLORS["text_normal"]))
         painter.drawText(int(x), int(y), self.label)
 
-        if self.selected and parent.editor_mode:
+        if self.selected and editor_mode:
             handle_size = min(
                 6, int(self.width() * 0.15)
             )  # Scale handle size with key size
-            handle_color = QColor(KEY_COLORS["resize_handle"])
-            painter.fillRect(0, 0, handle_size, handle_size, handle_color)
-            painter.fillRect(
-                self.width() - handle_size, 0, handle_size, handle_size, handle_color
-            )
-            painter.fillRect(
-                0, self.height() - handle_size, handle_size, handle_size, handle_color
-            )
-            painter.fillRect(
-                self.width() - handle_size,
-                self.height() - handle_size,
-                handle_size,
-                handle_size,
-                handle_color,
-            )
-
-    def getResizeHandle(self, pos: QPoint) -> Optional[str]:
+            right = self.width() - handle_size
+            bottom = self.height() - handle_size
+            # Fill all four handles in a single call
+            handles = QPainterPath()
+            for handle_x, handle_y in (
+                (0, 0),
+                (right, 0),
+                (0, bottom),
+                (right, bottom),
+            ):
+                handles.addRect(handle_x, handle_y, handle_size, handle_size)
+            painter.fillPath(handles, KEY_COLORS["resize_handle"])
+
+        painter.end()
+        return face
+
+    def getResizeHandle(self, pos: QPoint) -> int:
         """
         Determine which resize handle is at the given position.
 
@@ -242,28 +499,28 @@ class KeyboardKey(QWidget):
             pos (QPoint): Mouse position relative to the key widget.
 
         Returns:
-            Optional[str]: Handle identifier ("top-left", "top-right", "bottom-left",
-                          "bottom-right") or None if not over a handle.
+            int: Handle identifier (HANDLE_TOP_LEFT, HANDLE_TOP_RIGHT,
+                HANDLE_BOTTOM_LEFT or HANDLE_BOTTOM_RIGHT) or HANDLE_NONE if not
+                over a handle.
         """
         handle_size = 6
-        if QRect(0, 0, handle_size, handle_size).contains(pos):
-            return "top-left"
-        elif QRect(self.width() - handle_size, 0, handle_size, handle_size).contains(
-            pos
-        ):
-            return "top-right"
-        elif QRect(0, self.height() - handle_size, handle_size, handle_size).contains(
-            pos
-        ):
-            return "bottom-left"
-        elif QRect(
-            self.width() - handle_size,
-            self.height() - handle_size,
-            handle_size,
-            handle_size,
-        ).contains(pos):
-            return "bottom-right"
-        return None
+        # Plain integer comparisons; this runs on every mouse move
+        x, y = pos.x(), pos.y()
+        if not (0 <= x < self.width() and 0 <= y < self.height()):
+            return HANDLE_NONE
+        left = x < handle_size
+        right = x >= self.width() - handle_size
+        top = y < handle_size
+        bottom = y >= self.height() - handle_size
+        if top and left:
+            return HANDLE_TOP_LEFT
+        elif top and right:
+            return HANDLE_TOP_RIGHT
+        elif bottom and left:
+            return HANDLE_BOTTOM_LEFT
+        elif bottom and right:
+            return HANDLE_BOTTOM_RIGHT
+        return HANDLE_NONE
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
@@ -278,7 +535,7 @@ class KeyboardKey(QWidget):
         Args:
             event (QMouseEvent): Mouse event containing button, position, and modifiers.
         """
-        parent = self.parent()
+        parent = self._canvas
         if parent is None:
             return
 
@@ -287,7 +544,8 @@ class KeyboardKey(QWidget):
             if handle and self.selected:
                 self.resizing = True
                 self.resize_handle = handle
-                self.offset = event.pos()
+                # Track resizes in parent coordinates since the key moves under the cursor
+                self.offset = self.mapToParent(event.pos())
             else:
                 if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
                     self.selected = not self.selected
@@ -299,7 +557,7 @@ class KeyboardKey(QWidget):
                         self.update()
                     self.dragging = True
                     self.offset = event.pos()
-                    parent.startDrag(event.pos())
+                    parent.startDrag(self.mapToParent(event.pos()))
         elif event.button() == Qt.MouseButton.RightButton:
             parent.removeKey(self)
 
@@ -313,11 +571,12 @@ class KeyboardKey(QWidget):
         Args:
             event (QMouseEvent): Mouse event containing button information.
         """
-        parent = self.parent()
+        parent = self._canvas
         if parent and event.button() == Qt.MouseButton.LeftButton:
+            self._flushGeometry()
             self.dragging = False
             self.resizing = False
-            self.resize_handle = None
+            self.resize_handle = HANDLE_NONE
             parent.endDrag()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -334,51 +593,89 @@ class KeyboardKey(QWidget):
         Args:
             event (QMouseEvent): Mouse event containing current position.
         """
-        parent = self.parent()
+        parent = self._canvas
         if parent is None or not parent.editor_mode:
             return
 
         if self.resizing:
-            delta = event.pos() - self.offset
-            new_size = self.size()
+            pos = self.mapToParent(event.pos())
+            delta = pos - self.offset
+            # Build on the geometry that is still waiting to be applied, if any
+            x, y, width, height = self._pending_geometry or (
+                self.x(),
+                self.y(),
+                self.width(),
+                self.height(),
+            )
 
-            if self.resize_handle in ["top-left", "bottom-left"]:
-                new_width = max(self.min_size, self.width() - delta.x())
-                if new_width != self.width():
-                    self.move(self.x() + (self.width() - new_width), self.y())
-                    new_size.setWidth(new_width)
+            if self.resize_handle & HANDLE_LEFT:
+                new_width = max(self.min_size, width - delta.x())
+                x += width - new_width
+                width = new_width
 
-            if self.resize_handle in ["top-right", "bottom-right"]:
-                new_size.setWidth(max(self.min_size, self.width() + delta.x()))
+            if self.resize_handle & HANDLE_RIGHT:
+                width = max(self.min_size, width + delta.x())
 
-            if self.resize_handle in ["top-left", "top-right"]:
-                new_height = max(self.min_size, self.height() - delta.y())
-                if new_height != self.height():
-                    self.move(self.x(), self.y() + (self.height() - new_height))
-                    new_size.setHeight(new_height)
+            if self.resize_handle & HANDLE_TOP:
+                new_height = max(self.min_size, height - delta.y())
+                y += height - new_height
+                height = new_height
 
-            if self.resize_handle in ["bottom-left", "bottom-right"]:
-                new_size.setHeight(max(self.min_size, self.height() + delta.y()))
+            if self.resize_handle & HANDLE_BOTTOM:
+                height = max(self.min_size, height + delta.y())
 
-            self.setFixedSize(new_size)
-            self.offset = event.pos()
+            self._pending_geometry = (x, y, width, height)
+            self._geometry_flush.start()
+            self.offset = pos
 
         elif self.dragging:
             new_pos = self.mapToParent(event.pos() - self.offset)
             if len(parent.drag_keys) > 1:
-                parent.updateDragPosition(event.pos(), self)
+                parent.updateDragPosition(self.mapToParent(event.pos()), self)
             else:
-                new_pos.setX(max(0, min(new_pos.x(), parent.width() - self.width())))
-                new_pos.setY(max(0, min(new_pos.y(), parent.height() - self.height())))
-                self.move(new_pos)
+                # Clamp with plain ints and use the move(int, int) overload
+                new_x: int = new_pos.x()
+                new_y: int = new_pos.y()
+                max_x: int = parent.width() - self.width()
+                max_y: int = parent.height() - self.height()
+                new_x = max_x if new_x > max_x else new_x
+                new_y = max_y if new_y > max_y else new_y
+                self._pending_geometry = (
+                    0 if new_x < 0 else new_x,
+                    0 if new_y < 0 else new_y,
+                    self.width(),
+                    self.height(),
+                )
+                self._geometry_flush.start()
         else:
             handle = self.getResizeHandle(event.pos())
-            if handle in ["top-left", "bottom-right"]:
+            if handle == HANDLE_NONE:
+                self.setCursor(Qt.CursorShape.ArrowCursor)
+            elif handle & HANDLE_FDIAG:
                 self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-            elif handle in ["top-right", "bottom-left"]:
-                self.setCursor(Qt.CursorShape.SizeBDiagCursor)
             else:
-                self.setCursor(Qt.CursorShape.ArrowCursor)
+                self.setCursor(Qt.CursorShape.SizeBDiagCursor)
+
+    def _flushGeometry(self) -> None:
+        """
+        Apply the most recent pending geometry from a drag or resize.
+
+        Called by the geometry flush timer once Qt has drained the queued mouse
+        events, so a burst of mouse moves results in a single move and resize
+        of the key, and a single repaint. Does nothing if nothing is pending.
+
+        Note:
+            The size and position are applied back to back in this one slot,
+            so the repaints they request are merged into a single paint
+            event. Setting a size the key already has is a no-op, so plain
+            drags only cost the move.
+        """
+        if self._pending_geometry is None:
+            return
+        x, y, width, height = self._pending_geometry
+        self._pending_geometry = None
+        self.setFixedSize(width, height)
+        self.move(x, y)
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """
@@ -393,7 +690,7 @@ class KeyboardKey(QWidget):
         Args:
             event (QMouseEvent): Mouse event (unused but required by Qt).
         """
-        parent = self.parent()
+        parent = self._canvas
         if parent and parent.editor_mode:
             new_label, ok = QInputDialog.getText(
                 self, "Edit Key Label", "Enter display label:", text=self.label
@@ -401,22 +698,31 @@ class KeyboardKey(QWidget):
             if ok:
                 self.label = new_label
                 dialog = KeyBindDialog(parent.keyboard_manager, self)
-                if dialog.exec() == QDialog.DialogCode.Accepted and dialog.key_info:
+                if (
+                    dialog.reset()
+                    and dialog.exec() == QDialog.DialogCode.Accepted
+                    and dialog.key_info
+                ):
                     self.key_bind = dialog.key_info["name"]
                     self.scan_code = dialog.key_info["scan_code"]
+                    # Resolve the sound for the new binding on the next press
+                    self.sound_effect = None
+                    self.rebound.emit()
                 self.update()
 
     def playSound(self) -> None:
         """
         Play the sound effect for this key.
 
-        Attempts to play the configured sound effect. If the sound is not
-        loaded, prints an error message instead of playing.
+        Attempts to play the configured sound effect, setting it up from the
+        key binding on the first press. If the sound is not loaded, prints an
+        error message instead of playing.
 
         This method is typically called when a key press is detected
         in visualizer mode.
         """
-        if self.sound_effect.isLoaded():
-            self.sound_effect.play()
+        effect = self.sound_effect or self.setSoundEffect(self.key_bind)
+        if effect.isLoaded():
+            effect.play()
         else:
             print("Sound not loaded.")
@@ -6,12 +6,10 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QMessageBox,
     QPushButton,
     QWidget,
 )
-from PyQt6.QtCore import QTimer
-from pathlib import Path
-import json
 from keyboard_visualizer.utils.config import load_dialog_colors
 
 if TYPE_CHECKING:
@@ -19,24 +17,27 @@ if TYPE_CHECKING:
 
 DIALOG_COLORS = load_dialog_colors()
 
-# Common dialog stylesheet
+# Common dialog stylesheet, applied once to the whole application and scoped
+# to the KeyViz dialogs, and the message boxes they show, so Qt parses it a
+# single time
 DIALOG_STYLE = f"""
-    QDialog {{
+    PasswordDialog, KeyBindDialog,
+    PasswordDialog QMessageBox, KeyBindDialog QMessageBox {{
         background-color: {DIALOG_COLORS['dialog_background']};
         color: {DIALOG_COLORS['text_color']};
     }}
-    QLabel {{
+    PasswordDialog QLabel, KeyBindDialog QLabel {{
         color: {DIALOG_COLORS['text_color']};
         padding: 5px;
     }}
-    QLineEdit {{
+    PasswordDialog QLineEdit, KeyBindDialog QLineEdit {{
         background-color: {DIALOG_COLORS['input_background']};
         color: {DIALOG_COLORS['text_color']};
         border: 1px solid {DIALOG_COLORS['input_border']};
         border-radius: 4px;
         padding: 6px;
     }}
-    QPushButton {{
+    PasswordDialog QPushButton, KeyBindDialog QPushButton {{
         background-color: {DIALOG_COLORS['button_normal']};
         color: {DIALOG_COLORS['button_text']};
         border: 1px solid {DIALOG_COLORS['button_border']};
@@ -44,10 +45,11 @@ DIALOG_STYLE = f"""
         padding: 6px 12px;
         min-width: 80px;
     }}
-    QPushButton:hover {{
+    PasswordDialog QPushButton:hover, KeyBindDialog QPushButton:hover {{
         background-color: {DIALOG_COLORS['button_hover']};
+        border: 1px solid {DIALOG_COLORS['button_border']};
     }}
-    QPushButton:pressed {{
+    PasswordDialog QPushButton:pressed, KeyBindDialog QPushButton:pressed {{
         background-color: {DIALOG_COLORS['button_pressed']};
     }}
 """
@@ -73,8 +75,8 @@ class PasswordDialog(QDialog):
         Initialize the PasswordDialog.
 
         Sets up the dialog with an explanation label, password input field,
-        and OK/Cancel buttons. The dialog is configured as modal and applies
-        the standard dialog styling.
+        and OK/Cancel buttons. The dialog is configured as modal and is styled
+        by DIALOG_STYLE, which the application applies once for all dialogs.
 
         Args:
             parent (Optional[QWidget]): Parent widget for the dialog, defaults to None.
@@ -82,7 +84,6 @@ class PasswordDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Authentication Required")
         self.setModal(True)
-        self.setStyleSheet(DIALOG_STYLE)
 
         layout: QVBoxLayout = QVBoxLayout()
 
@@ -131,16 +132,19 @@ class KeyBindDialog(QDialog):
     a keyboard key widget. It automatically detects the key press and captures
     both the key name and scan code for use in keyboard monitoring.
 
-    The dialog uses a timer to continuously check for key presses through
-    the keyboard manager's wait_for_key method. Once a key is detected,
-    the dialog automatically closes and provides the key information.
+    The dialog asks the keyboard manager to capture the next key press and
+    listens for its key_captured signal, so it doesn't poll. Once a key is
+    detected, the dialog automatically closes and provides the key information.
+
+    Call reset() before each exec() to clear the previous key and start
+    detecting a new one, and only execute the dialog if it returned True.
+    A single dialog can be shown repeatedly this way.
 
     Attributes:
         keyboard_manager (KeyboardManager): Manager for detecting key presses.
         layout (QVBoxLayout): Main layout for dialog components.
         label (QLabel): Instruction label for the user.
         key_info (Optional[Dict[str, Any]]): Information about the detected key.
-        timer (QTimer): Timer for polling key detection.
     """
 
     def __init__(
@@ -149,8 +153,9 @@ class KeyBindDialog(QDialog):
         """
         Initialize the KeyBindDialog.
 
-        Sets up the dialog with an instruction label and starts the key detection
-        timer. The dialog is configured as modal and applies standard styling.
+        Sets up the dialog with an instruction label. The dialog is configured
+        as modal and is styled by DIALOG_STYLE. Key detection starts when
+        reset() is called.
 
         Args:
             keyboard_manager (KeyboardManager): The keyboard manager for key detection.
@@ -159,7 +164,6 @@ class KeyBindDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Press a Key")
         self.setModal(True)
-        self.setStyleSheet(DIALOG_STYLE)
 
         self.keyboard_manager: "KeyboardManager" = keyboard_manager
         self.layout: QVBoxLayout = QVBoxLayout()
@@ -169,24 +173,57 @@ class KeyBindDialog(QDialog):
         self.key_info: Optional[Dict[str, Any]] = None
         self.setLayout(self.layout)
 
-        # Start key detection
-        self.timer: QTimer = QTimer()
-        self.timer.timeout.connect(self.check_key)
-        self.timer.start(100)
+    def reset(self) -> bool:
+        """
+        Prepare the dialog to capture a new key.
+
+        Clears the previously detected key and starts capturing a new one,
+        without rebuilding any of the dialog's widgets. If the keyboard helper
+        can't capture keys, an error is shown instead, since the dialog would
+        otherwise wait for a key that never comes.
 
-    def check_key(self) -> None:
+        Returns:
+            bool: True if key capture started, False otherwise.
         """
-        Check for key presses and handle key detection.
+        self.key_info = None
+        self.stop_capture()
+        self.keyboard_manager.key_captured.connect(self.on_key_captured)
+        if self.keyboard_manager.capture_key():
+            return True
+        self.stop_capture()
+        QMessageBox.critical(
+            self, "Error", "Failed to capture key: keyboard helper stopped."
+        )
+        return False
 
-        This method is called periodically by the timer to check if a key
-        has been pressed. When a key is detected, it stores the key information,
-        stops the timer, and accepts the dialog.
+    def done(self, result: int) -> None:
+        """
+        Close the dialog and stop key detection.
 
-        The key information includes both the key name and scan code needed
-        for keyboard monitoring operations.
+        Args:
+            result (int): The dialog result code.
+        """
+        self.stop_capture()
+        super().done(result)
+
+    def stop_capture(self) -> None:
+        """Stop listening for the captured key, if still listening."""
+        try:
+            self.keyboard_manager.key_captured.disconnect(self.on_key_captured)
+        except TypeError:
+            return
+        self.keyboard_manager.cancel_capture()
+
+    def on_key_captured(self, key_info: Dict[str, Any]) -> None:
+        """
+        Handle the key captured by the keyboard manager.
+
+        Stores the key information and accepts the dialog. The key
+        information includes both the key name and scan code needed for
+        keyboard monitoring operations.
+
+        Args:
+            key_info (Dict[str, Any]): Scan code and name of the pressed key.
         """
-        key_info: Optional[Dict[str, Any]] = self.keyboard_manager.wait_for_key()
-        if key_info:
-            self.key_info = key_info  # This now contains both name and scan_code
-            self.timer.stop()
-            self.accept()
+        self.key_info = key_info
+        self.accept()
@@ -1,7 +1,7 @@
 import sys
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -11,16 +11,46 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QFileDialog,
 )
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QCloseEvent
 
 from keyboard_visualizer.ui.components.keyboard_canvas import KeyboardCanvas
+from keyboard_visualizer.ui.components.keyboard_key import KeyboardKey
 from keyboard_visualizer.core.keyboard_manager import KeyboardManager
 from keyboard_visualizer.utils.config import load_main_window_settings
 
 
 MAIN_WINDOW_SETTINGS = load_main_window_settings()
-print(f"Loaded main window settings: {MAIN_WINDOW_SETTINGS}\n")
+
+# Main window stylesheet, applied once to the whole application. Buttons are
+# scoped to the main window so they are styled like before without touching
+# other top-level windows.
+MAIN_WINDOW_STYLE = f"""
+    QMainWindow {{
+        background-color: {MAIN_WINDOW_SETTINGS['main_background']};
+    }}
+    QMainWindow QPushButton {{
+        background-color: {MAIN_WINDOW_SETTINGS['button_normal']};
+        color: {MAIN_WINDOW_SETTINGS['button_text']};
+        border: 1px solid {MAIN_WINDOW_SETTINGS['button_border']};
+        border-radius: 6px;
+        padding: 2px;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QMainWindow QPushButton:hover {{
+        background-color: {MAIN_WINDOW_SETTINGS['button_hover']};
+        border: 2px solid {MAIN_WINDOW_SETTINGS['button_border']};
+    }}
+    QMainWindow QPushButton:pressed {{
+        background-color: {MAIN_WINDOW_SETTINGS['button_pressed']};
+    }}
+    QMainWindow QPushButton:disabled {{
+        background-color: {MAIN_WINDOW_SETTINGS['button_disabled_bg']};
+        color: {MAIN_WINDOW_SETTINGS['button_disabled_text']};
+        border: 1px solid {MAIN_WINDOW_SETTINGS['button_disabled_text']};
+    }}
+"""
 
 
 class MainWindow(QMainWindow):
@@ -40,7 +70,9 @@ class MainWindow(QMainWindow):
         load_btn (QPushButton): Button for loading keyboard layouts.
         toggle_mode_btn (QPushButton): Button for switching between editor/visualizer modes.
         toggle_visibility_btn (QPushButton): Button for hiding/showing toolbar.
-        state_check_timer (QTimer): Timer for checking keyboard state updates.
+        key_map (Dict[int, KeyboardKey]): Monitored keys by scan code, built when
+            the visualizer starts and rebuilt whenever the canvas keys change
+            while it runs.
     """
 
     def __init__(
@@ -60,36 +92,9 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.interface_minimized: bool = False
         self.hideable_buttons: List[QPushButton] = []
+        self.key_map: Dict[int, KeyboardKey] = {}
         self.setWindowTitle("KeyViz")
         self.setMinimumSize(4, 3)
-        self.setStyleSheet(
-            f"""
-            QMainWindow {{
-                background-color: {MAIN_WINDOW_SETTINGS['main_background']};
-            }}
-            QPushButton {{
-                background-color: {MAIN_WINDOW_SETTINGS['button_normal']};
-                color: {MAIN_WINDOW_SETTINGS['button_text']};
-                border: 1px solid {MAIN_WINDOW_SETTINGS['button_border']};
-                border-radius: 6px;
-                padding: 2px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {MAIN_WINDOW_SETTINGS['button_hover']};
-                border: 2px solid {MAIN_WINDOW_SETTINGS['button_border']};
-            }}
-            QPushButton:pressed {{
-                background-color: {MAIN_WINDOW_SETTINGS['button_pressed']};
-            }}
-            QPushButton:disabled {{
-                background-color: {MAIN_WINDOW_SETTINGS['button_disabled_bg']};
-                color: {MAIN_WINDOW_SETTINGS['button_disabled_text']};
-                border: 1px solid {MAIN_WINDOW_SETTINGS['button_disabled_text']};
-            }}
-            """
-        )
 
         # Initialize keyboard manager
         self.keyboard_manager: KeyboardManager = KeyboardManager()
@@ -152,16 +157,15 @@ class MainWindow(QMainWindow):
         layout.addLayout(toolbar)
         layout.addWidget(self.canvas)
 
-        # Setup state check timer
-        self.state_check_timer: QTimer = QTimer(self)
-        self.state_check_timer.timeout.connect(self.check_keyboard_state)
-        self.state_check_timer.setInterval(16)  # ~60 FPS
+        # Update keys whenever the keyboard manager reports a state change
+        self.keyboard_manager.state_changed.connect(self.check_keyboard_state)
+        # Keep the monitored keys in sync with keys added or removed meanwhile
+        self.canvas.keys_changed.connect(self.refreshMonitoredKeys)
 
         if layout_path:
             try:
-                with open(layout_path, "r") as f:
-                    config = json.load(f)
-                    self.canvas.loadConfiguration(config)
+                config = json.loads(Path(layout_path).read_bytes())
+                self.canvas.loadConfiguration(config)
             except Exception as e:
                 print(f"Error loading layout: {e}")
 
@@ -173,13 +177,11 @@ class MainWindow(QMainWindow):
         - Keyboard monitoring is disabled
         - Save/load buttons are enabled
         - Cursor changes to crosshair for editing
-        - State checking timer is stopped
 
         In visualizer mode:
         - Keyboard monitoring is enabled for configured keys
         - Save/load buttons are disabled
         - Cursor changes to arrow
-        - State checking timer is started
         """
         self.canvas.toggleEditorMode(not self.canvas.editor_mode)
         editor_widgets = [self.save_btn, self.load_btn]
@@ -190,22 +192,40 @@ class MainWindow(QMainWindow):
             for widget in editor_widgets:
                 widget.setEnabled(True)
             self.keyboard_manager.stop_monitoring()
+            self.key_map = {}
             self.canvas.setCursor(Qt.CursorShape.CrossCursor)
-            self.state_check_timer.stop()
         else:
             self.toggle_mode_btn.setText("")
             self.toggle_mode_btn.setToolTip("Stop Visualizer")
             for widget in editor_widgets:
                 widget.setEnabled(False)
             # Start monitoring with current key scan codes
-            scan_codes = [
-                key.scan_code for key in self.canvas.keys if key.scan_code is not None
-            ]
-            if scan_codes:  # Only start monitoring if we have keys to monitor
-                self.keyboard_manager.start_monitoring(scan_codes)
-                self.state_check_timer.start()
+            self.refreshMonitoredKeys()
             self.canvas.setCursor(Qt.CursorShape.ArrowCursor)
 
+    def refreshMonitoredKeys(self) -> None:
+        """
+        Rebuild the scan code map and monitor the canvas's current keys.
+
+        Called when the visualizer starts and whenever the canvas reports that
+        its keys changed, so a key removed while the visualizer runs stops
+        reacting to key states and newly added keys start doing so. The sounds
+        of the monitored keys start loading here as well. Does nothing in
+        editor mode, where no keys are monitored.
+        """
+        if self.canvas.editor_mode:
+            return
+        self.key_map = self.canvas.scanCodeIndex()
+        # Start loading the monitored keys' sounds so each first press is audible
+        KeyboardKey.preloadSounds(self.key_map.values())
+        if self.key_map:  # Only monitor if we have keys to monitor
+            if not self.keyboard_manager.start_monitoring(list(self.key_map)):
+                QMessageBox.critical(
+                    self, "Error", "Failed to monitor keys: keyboard helper stopped."
+                )
+        else:
+            self.keyboard_manager.stop_monitoring()
+
     def saveLayout(self) -> None:
         """
         Open a file dialog to save the current keyboard layout configuration.
@@ -213,13 +233,16 @@ class MainWindow(QMainWindow):
         Prompts the user to select a location and filename for saving the
         keyboard layout as a JSON file. The configuration is obtained from
         the canvas and saved to the selected file.
+
+        The layout is encoded in one go with the C-accelerated encoder used by
+        json.dumps and written with a single call, rather than streamed through
+        json.dump's pure-Python encoder.
         """
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Layout", "", "JSON Files (*.json)"
         )
         if filename:
-            with open(filename, "w") as f:
-                json.dump(self.canvas.getConfiguration(), f)
+            Path(filename).write_text(json.dumps(self.canvas.getConfiguration()))
 
     def loadLayout(self) -> None:
         """
@@ -233,9 +256,8 @@ class MainWindow(QMainWindow):
             self, "Load Layout", "", "JSON Files (*.json)"
         )
         if filename:
-            with open(filename, "r") as f:
-                config = json.load(f)
-                self.canvas.loadConfiguration(config)
+            config = json.loads(Path(filename).read_bytes())
+            self.canvas.loadConfiguration(config)
 
     def toggleVisibility(self) -> None:
         """
@@ -268,19 +290,22 @@ class MainWindow(QMainWindow):
             self.toggle_visibility_btn.setFixedSize(22, 22)
             self.interface_minimized = True
 
-    def check_keyboard_state(self) -> None:
+    def check_keyboard_state(self, key_states: Dict[int, bool]) -> None:
         """
         Check and update keyboard key states in visualizer mode.
 
-        This method runs at approximately 60 FPS when the state check timer
-        is active. It retrieves current key states from the keyboard manager
-        and updates the visual representation of keys on the canvas.
+        This method is connected to the keyboard manager's state_changed
+        signal, so it only runs when a monitored key actually changes. Only
+        the keys whose state changed are repainted.
 
         The method handles:
-        - Converting scan codes to appropriate types
+        - Looking up keys in the scan code map built when the visualizer started
         - Triggering sound effects when keys are pressed
         - Updating visual state of keys
-        - Error handling for invalid scan codes
+
+        Args:
+            key_states (Dict[int, bool]): The scan codes whose state changed,
+                mapped to their new state.
 
         Note:
             Only executes when not in editor mode to avoid interfering
@@ -288,28 +313,15 @@ class MainWindow(QMainWindow):
         """
         if not self.canvas.editor_mode:  # Only check states in visualizer mode
             try:
-                key_states: Dict[Union[str, int], bool] = (
-                    self.keyboard_manager.get_key_states()
-                )
-                key_map = {
-                    key.scan_code: key
-                    for key in self.canvas.keys
-                    if key.scan_code is not None
-                }
-
                 for scan_code, is_pressed in key_states.items():
-                    try:
-                        # Try to convert scan_code to int if it's a string
-                        if isinstance(scan_code, str):
-                            scan_code = int(scan_code)
-                        if scan_code in key_map:
-                            if key_map[scan_code].pressed == False and is_pressed:
-                                key_map[scan_code].playSound()
-                            key_map[scan_code].pressed = is_pressed
-                            key_map[scan_code].update()
-                    except (ValueError, TypeError):
-                        # Skip invalid scan codes
-                        continue
+                    key = self.key_map.get(scan_code)
+                    # The key itself is the last state seen, so keys already
+                    # showing this state are neither replayed nor repainted
+                    if key is not None and key.pressed != is_pressed:
+                        if is_pressed:
+                            key.playSound()
+                        key.pressed = is_pressed
+                        key.update()
 
             except Exception as e:
                 print(f"Error checking keyboard state: {e}")
@@ -319,13 +331,11 @@ class MainWindow(QMainWindow):
         Handle the window close event.
 
         Performs cleanup operations before the window closes:
-        - Stops the state check timer
         - Stops the keyboard manager
         - Accepts the close event
 
         Args:
             event (QCloseEvent): The close event object.
         """
-        self.state_check_timer.stop()
         self.keyboard_manager.stop()
         event.accept()
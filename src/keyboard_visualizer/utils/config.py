@@ -1,13 +1,18 @@
 import json
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# Default configuration file bundled with the app
+DEFAULT_CONFIG_PATH = Path(__file__).parents[3] / "config/default.json"
+
 
 def get_default_config_path() -> Path:
     """Get the path to the default configuration file bundled with the app."""
-    path = Path(__file__).parent.parent.parent.parent / "config/default.json"
-    print(f"Default config path: {path}")
-    return path
+    return DEFAULT_CONFIG_PATH
 
 
 def get_user_config_path() -> Path:
@@ -15,23 +20,32 @@ def get_user_config_path() -> Path:
     return Path.home() / ".config" / "KeyViz" / "config.json"
 
 
+@lru_cache(maxsize=1)
 def load_default_config() -> Dict[str, Any]:
-    """Load the default configuration bundled with the app."""
+    """Load the default configuration bundled with the app.
+
+    The file is read once per process; the returned dict is shared and must
+    not be modified.
+    """
     default_config_path = get_default_config_path()
+    logger.debug("Default config path: %s", default_config_path)
     try:
-        with open(default_config_path, "r") as f:
-            return json.load(f)
+        return json.loads(default_config_path.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load default config: {e}")
         exit(1)
 
 
+@lru_cache(maxsize=1)
 def load_user_config() -> Dict[str, Any]:
-    """Load the user's configuration file."""
+    """Load the user's configuration file.
+
+    The file is read once per process, until the user config is written
+    again; the returned dict is shared and must not be modified.
+    """
     user_config_path = get_user_config_path()
     try:
-        with open(user_config_path, "r") as f:
-            return json.load(f)
+        return json.loads(user_config_path.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
@@ -40,6 +54,9 @@ def merge_configs(
     default_config: Dict[str, Any], user_config: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Recursively merge user config into default config."""
+    if not user_config:
+        # Nothing to override, so the defaults can be used as they are
+        return default_config
     merged = default_config.copy()
 
     for key, value in user_config.items():
@@ -53,35 +70,42 @@ def merge_configs(
     return merged
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load the complete configuration (default + user overrides)."""
+    """Load the complete configuration (default + user overrides).
+
+    The merged configuration is cached until the user config is written
+    again; the returned dict is shared and must not be modified.
+    """
     default_config = load_default_config()
     user_config = load_user_config()
 
     return merge_configs(default_config, user_config)
 
 
+def get_config_section(name: str) -> Dict[str, Any]:
+    """Get one top-level section of the cached configuration."""
+    return load_config().get(name, {})
+
+
 def load_key_colors() -> Dict[str, str]:
     """Load key colors from configuration."""
-    config = load_config()
-    colors = config.get("key_colors", {})
-    print(f"Loaded key colors: {colors}\n")
+    colors = get_config_section("key_colors")
+    logger.debug("Loaded key colors: %s", colors)
     return colors
 
 
 def load_main_window_settings() -> Dict[str, str]:
     """Load main window colors from configuration."""
-    config = load_config()
-    settings = config.get("main_window", {})
-    print(f"Loaded main window settings colors: {settings}\n")
+    settings = get_config_section("main_window")
+    logger.debug("Loaded main window settings colors: %s", settings)
     return settings
 
 
 def load_dialog_colors() -> Dict[str, str]:
     """Load dialog colors from configuration."""
-    config = load_config()
-    colors = config.get("dialog_colors", {})
-    print(f"Loaded dialog colors: {colors}\n")
+    colors = get_config_section("dialog_colors")
+    logger.debug("Loaded dialog colors: %s", colors)
     return colors
 
 
@@ -97,6 +121,7 @@ def create_default_user_config() -> None:
 
     with open(user_config_path, "w") as f:
         json.dump(default_config, f, indent=2)
+    clear_config_cache()
 
     print(f"Created default user configuration at: {user_config_path}")
 
@@ -108,3 +133,10 @@ def save_user_config(config: Dict[str, Any]):
 
     with open(user_config_path, "w") as f:
         json.dump(config, f, indent=2)
+    clear_config_cache()
+
+
+def clear_config_cache() -> None:
+    """Drop the cached user and merged configuration so they are read again."""
+    load_user_config.cache_clear()
+    load_config.cache_clear()
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import keyboard
 import json
+import socket
 import sys
-import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, FrozenSet, List, Any
+
+# Compact JSON separators for messages exchanged with the main application
+IPC_SEPARATORS = (",", ":")
+# Largest command accepted from the main application, in bytes
+MAX_MESSAGE_SIZE = 65536
 
 
 class KeyboardHelper:
@@ -14,66 +19,69 @@ class KeyboardHelper:
 
     This class runs as a separate process with elevated privileges to monitor
     keyboard input events. It communicates with the main application through
-    temporary files, processing commands to wait for key presses or monitor
-    specific keys continuously.
+    a Unix domain socket opened by the application, processing commands to
+    capture key presses or monitor specific keys continuously.
 
     The helper supports two main operations:
-    1. Single key detection: Wait for any key press and return its information
-    2. Continuous monitoring: Monitor specific keys and maintain their state
+    1. Single key detection: Capture the next key press and send its information
+    2. Continuous monitoring: Monitor specific keys and send their state
 
     Attributes:
-        tmp_dir (Path): Directory for temporary communication files.
-        command_file (Path): File for receiving commands from the main application.
-        response_file (Path): File for sending responses back to the main application.
-        running_file (Path): File indicating the helper process is running.
+        connection (socket.socket): Connection to the main application.
         key_states (Dict[int, bool]): Current state of monitored keys (scan_code -> pressed).
         last_error_time (float): Timestamp of last error to prevent spam logging.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, socket_path: Path) -> None:
         """
         Initialize the KeyboardHelper.
 
-        Sets up the temporary directory structure for inter-process communication,
-        clears any existing communication files, creates the running indicator file,
-        and initializes key state tracking.
-        """
-        self.tmp_dir: Path = Path("/tmp/keyboard_visualizer")
-        self.tmp_dir.mkdir(exist_ok=True)
-
-        self.command_file: Path = self.tmp_dir / "command"
-        self.response_file: Path = self.tmp_dir / "response"
-        self.running_file: Path = self.tmp_dir / "running"
+        Connects to the main application's socket and initializes key state
+        tracking. The main application treats the connection as the signal
+        that the helper is ready.
 
-        # Clear any existing files
-        for file in [self.command_file, self.response_file]:
-            if file.exists():
-                file.unlink()
-
-        # Create running file to indicate the helper is active
-        self.running_file.touch()
+        Args:
+            socket_path (Path): Path of the socket the main application listens on.
+        """
+        self.connection: socket.socket = socket.socket(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        self.connection.connect(str(socket_path))
 
         # Store current key states
         self.key_states: Dict[int, bool] = {}
         self.last_error_time: float = 0  # Track last error time to reduce spam
 
-    def wait_for_key(self) -> Optional[Dict[str, Any]]:
+    def send(self, message: Dict[str, Any]) -> None:
         """
-        Wait for a single keypress and return its information.
+        Send a JSON-encoded message to the main application as a single packet.
 
-        Sets up a keyboard hook to capture the next key press event and returns
-        information about the pressed key including its scan code and name.
-        This method blocks until a key is pressed.
+        Args:
+            message (Dict[str, Any]): Message to send.
+        """
+        try:
+            self.connection.send(
+                json.dumps(message, separators=IPC_SEPARATORS).encode()
+            )
+        except OSError as err:
+            print(f"Error sending message: {err}")
+
+    def capture_key(self) -> None:
+        """
+        Capture the next keypress and send its information.
 
-        Returns:
-            Optional[Dict[str, Any]]: Dictionary containing 'scan_code' and 'name'
-                of the pressed key, or None if an error occurs.
+        Sets up a keyboard hook that sends the scan code and name of the next
+        pressed key to the main application as a 'key_info' message. This
+        method returns immediately so the helper keeps processing commands
+        while it waits for the key.
 
         Note:
             This method unhooks all existing keyboard handlers and sets up a
             temporary hook that removes itself after capturing one key press.
+            Capturing again replaces any hook that is still waiting.
         """
-        key_info: Optional[Dict[str, Any]] = None
+        keyboard.unhook_all()
+        captured: bool = False
 
         def on_key(event: keyboard.KeyboardEvent) -> None:
             """
@@ -82,25 +90,24 @@ class KeyboardHelper:
             Args:
                 event (keyboard.KeyboardEvent): The keyboard event containing key information.
             """
-            nonlocal key_info
-            if event.event_type == keyboard.KEY_DOWN:
-                key_info = {
+            nonlocal captured
+            if event.event_type == keyboard.KEY_DOWN and not captured:
+                captured = True
+                keyboard.unhook_all()
+                key_info: Dict[str, Any] = {
                     "scan_code": event.scan_code,
                     "name": event.name,
                 }
-                keyboard.unhook_all()
+                self.send({"key_info": key_info})
 
         keyboard.hook(on_key)
-        while not key_info:
-            time.sleep(0.1)
-        return key_info
 
     def start_monitoring(self, scan_codes: List[int]) -> None:
         """
         Start monitoring keys based on their scan codes.
 
         Sets up continuous monitoring of the specified keys, tracking their
-        press/release states and writing updates to the response file. This
+        press/release states and sending updates to the main application. This
         method replaces any existing keyboard hooks.
 
         Args:
@@ -108,11 +115,16 @@ class KeyboardHelper:
                 for these scan codes will be tracked and reported.
 
         Note:
-            The key states are continuously updated in the response file as JSON.
-            Each monitored scan code maps to a boolean indicating if it's pressed.
+            Every update is a 'key_state' message holding only the scan code
+            that changed and whether it's pressed, so the cost of an update
+            does not grow with the number of monitored keys. Repeated presses
+            sent while a key is held down don't change its state and are not
+            sent.
         """
         keyboard.unhook_all()
         self.key_states = {}  # Reset states
+        # Set lookup keeps the per-event filter constant time
+        monitored: FrozenSet[int] = frozenset(scan_codes)
 
         def on_key_event(e: keyboard.KeyboardEvent) -> None:
             """
@@ -121,14 +133,12 @@ class KeyboardHelper:
             Args:
                 e (keyboard.KeyboardEvent): The keyboard event to process.
             """
-            print(f"Key: {e.name}, Scan code: {e.scan_code}")
-            if e.scan_code in scan_codes:
-                self.key_states[e.scan_code] = e.event_type == keyboard.KEY_DOWN
-                try:
-                    with open(self.response_file, "w") as f:
-                        json.dump(self.key_states, f)
-                except Exception as err:
-                    print(f"Error writing state: {err}")
+            scan_code: int = e.scan_code
+            if scan_code in monitored:
+                pressed: bool = e.event_type == keyboard.KEY_DOWN
+                if self.key_states.get(scan_code) != pressed:
+                    self.key_states[scan_code] = pressed
+                    self.send({"key_state": [scan_code, pressed]})
 
         keyboard.hook(on_key_event)
 
@@ -136,12 +146,12 @@ class KeyboardHelper:
         """
         Main loop to handle commands from the parent process.
 
-        Continuously checks for command files and processes them based on their
-        command type. Supports 'wait_key', 'monitor', and 'stop_monitor' commands.
-        The loop continues until the running file is removed.
+        Blocks on the connection until a command arrives and processes it based
+        on its command type. Supports 'wait_key', 'monitor', and 'stop_monitor'
+        commands. The loop ends when the main application closes the connection.
 
         Command Types:
-        - wait_key: Wait for a single key press and return its information
+        - wait_key: Capture the next key press and send its information
         - monitor: Start monitoring specified scan codes continuously
         - stop_monitor: Stop all monitoring and clear key states
 
@@ -150,36 +160,29 @@ class KeyboardHelper:
         """
         print("Keyboard helper running with elevated privileges...")
 
-        while self.running_file.exists():
+        while True:
             try:
-                if self.command_file.exists():
-                    with open(self.command_file, "r") as f:
-                        command: Dict[str, Any] = json.load(f)
-
-                    # Handle different command types
-                    if command["type"] == "wait_key":
-                        key_info: Optional[Dict[str, Any]] = self.wait_for_key()
-                        with open(self.response_file, "w") as f:
-                            json.dump({"key_info": key_info}, f)
-
-                    elif command["type"] == "monitor":
-                        self.start_monitoring(command["scan_codes"])
-
-                    elif command["type"] == "stop_monitor":
-                        keyboard.unhook_all()
-                        self.key_states.clear()
-                        if self.response_file.exists():
-                            self.response_file.unlink()
-
-                    # Remove the command file after processing
-                    self.command_file.unlink()
-
-            except FileNotFoundError:
-                # Command file doesn't exist yet, just wait
-                time.sleep(0.1)
-            except json.JSONDecodeError:
-                # File might be partially written, wait and retry
-                time.sleep(0.1)
+                data: bytes = self.connection.recv(MAX_MESSAGE_SIZE)
+            except OSError:
+                break
+            if not data:
+                # The main application closed the connection
+                break
+
+            try:
+                command: Dict[str, Any] = json.loads(data)
+
+                # Handle different command types
+                if command["type"] == "wait_key":
+                    self.capture_key()
+
+                elif command["type"] == "monitor":
+                    self.start_monitoring(command["scan_codes"])
+
+                elif command["type"] == "stop_monitor":
+                    keyboard.unhook_all()
+                    self.key_states.clear()
+
             except Exception as e:
                 # Only print error if enough time has passed since last error
                 current_time: float = time.time()
@@ -189,15 +192,11 @@ class KeyboardHelper:
                     print(f"Error in helper: {e}")
                     self.last_error_time = current_time
 
-            time.sleep(0.1)  # Add a small delay to prevent busy waiting
-
         # Cleanup on exit
         keyboard.unhook_all()
-        for file in [self.command_file, self.response_file, self.running_file]:
-            if file.exists():
-                file.unlink()
+        self.connection.close()
 
 
 if __name__ == "__main__":
-    helper: KeyboardHelper = KeyboardHelper()
+    helper: KeyboardHelper = KeyboardHelper(Path(sys.argv[1]))
     helper.run()
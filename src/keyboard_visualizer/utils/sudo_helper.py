@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 import subprocess
 import sys
-import os
-from pathlib import Path
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any
 
 
 class SudoHelper:
@@ -14,12 +12,16 @@ class SudoHelper:
     multiple commands with elevated privileges without repeatedly prompting for passwords.
     It's specifically designed for running Python scripts that require root access.
 
-    The helper stores the authenticated password securely in memory and uses it to
-    execute subsequent commands. It provides methods for testing authentication,
-    running arbitrary sudo commands, and specifically running Python scripts.
+    The helper keeps the authenticated password in memory until it has been
+    handed to the next sudo command, then forgets it. It provides methods for
+    testing authentication, running arbitrary sudo commands, and specifically
+    running Python scripts.
 
     Attributes:
-        _sudo_password (Optional[str]): The authenticated sudo password stored in memory.
+        _sudo_password (Optional[str]): The authenticated sudo password, kept
+            only until the next command is run.
+        _cached_credentials (bool): Whether sudo already had valid cached
+            credentials, so commands can run without a password.
     """
 
     def __init__(self) -> None:
@@ -30,6 +32,27 @@ class SudoHelper:
         performed using the authenticate() method before running sudo commands.
         """
         self._sudo_password: Optional[str] = None
+        self._cached_credentials: bool = False
+
+    def authenticate_cached(self) -> bool:
+        """
+        Check whether sudo can run commands without asking for a password.
+
+        Runs 'sudo -n true', which succeeds right away when sudo still has
+        valid cached credentials (or doesn't need a password at all) and fails
+        instead of prompting otherwise. If it succeeds, later commands are run
+        the same way and no password is needed.
+
+        Returns:
+            bool: True if sudo can be used without a password, False otherwise.
+        """
+        result = subprocess.run(
+            ["sudo", "-n", "true"],
+            stderr=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        self._cached_credentials = result.returncode == 0
+        return self._cached_credentials
 
     def authenticate(self, password: str) -> bool:
         """
@@ -69,8 +92,12 @@ class SudoHelper:
         Run a command with sudo using the stored password.
 
         Executes the specified command with sudo privileges, automatically
-        providing the stored password through stdin. The command is run
-        asynchronously and returns a Popen object for further interaction.
+        providing the stored password through stdin, or relying on sudo's
+        cached credentials if authenticate_cached() succeeded. The password is
+        cleared once written, so it does not stay in memory for the rest of
+        the session; authenticate again before running another command with
+        a password. The command is run asynchronously and returns a Popen
+        object for further interaction.
 
         Args:
             cmd (List[str]): Command and arguments to execute with sudo.
@@ -83,22 +110,27 @@ class SudoHelper:
         Raises:
             RuntimeError: If no sudo password is available (authentication required).
         """
-        if not self._sudo_password:
-            raise RuntimeError("Not authenticated")
-
-        full_cmd = ["sudo", "-S"] + cmd
         kwargs.setdefault("stdout", subprocess.PIPE)
         kwargs.setdefault("stderr", subprocess.PIPE)
+        if not self._sudo_password:
+            if not self._cached_credentials:
+                raise RuntimeError("Not authenticated")
+            return subprocess.Popen(["sudo", "-n"] + cmd, **kwargs)
+
+        # The password comes from stdin, so sudo's prompt would only be noise
+        full_cmd = ["sudo", "-S", "-p", ""] + cmd
 
         process = subprocess.Popen(full_cmd, stdin=subprocess.PIPE, **kwargs)
 
-        # Send password to stdin
+        # Send password to stdin, then close it so the pipe is not kept open
+        # for the lifetime of the privileged process
         process.stdin.write(self._sudo_password.encode() + b"\n")
-        process.stdin.flush()
+        process.stdin.close()
+        self._sudo_password = None
 
         return process
 
-    def run_python_script(self, script_path, *args):
+    def run_python_script(self, script_path, *args, **kwargs):
         """
         Run a Python script with sudo using the stored password.
         Executes the specified Python script with sudo privileges, automatically
@@ -107,10 +139,11 @@ class SudoHelper:
         Args:
             script_path (str or Path): Path to the Python script to execute.
             *args: Additional arguments to pass to the script.
+            **kwargs: Additional keyword arguments passed to run_sudo().
         Returns:
             subprocess.Popen: Process object for the running script.
         Raises:
             RuntimeError: If no sudo password is available (authentication required).
         """
         cmd = [sys.executable, str(script_path)] + list(args)
-        return self.run_sudo(cmd)
+        return self.run_sudo(cmd, **kwargs)
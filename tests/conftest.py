@@ -0,0 +1,20 @@
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+# Run the widgets without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def layout() -> Dict[str, List[Dict[str, Any]]]:
+    """A layout with two bound keys, scan codes 30 and 31, and an unbound one."""
+    size = {"width": 40, "height": 40}
+    return {
+        "keys": [
+            {"label": "A", "key_bind": "a", "scan_code": 30, "x": 0, "y": 0, **size},
+            {"label": "S", "key_bind": "s", "scan_code": 31, "x": 50, "y": 0, **size},
+            {"label": "?", "key_bind": "", "scan_code": None, "x": 100, "y": 0, **size},
+        ]
+    }
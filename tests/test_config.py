@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from keyboard_visualizer.utils import config
+
+
+@pytest.fixture(autouse=True)
+def user_config_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    """A user config path in a temporary directory, with the caches empty."""
+    path = tmp_path / "KeyViz" / "config.json"
+    monkeypatch.setattr(config, "get_user_config_path", lambda: path)
+    config.clear_config_cache()
+    yield path
+    config.clear_config_cache()
+
+
+def test_saved_user_config_is_loaded_again() -> None:
+    assert config.load_user_config() == {}
+    config.get_config_section("key_colors")
+
+    config.save_user_config({"key_colors": {"pressed": "#123456"}})
+
+    assert config.load_user_config() == {"key_colors": {"pressed": "#123456"}}
+    assert config.get_config_section("key_colors")["pressed"] == "#123456"
+
+
+def test_created_user_config_is_loaded_again(user_config_path: Path) -> None:
+    config.save_user_config({"key_colors": {"pressed": "#123456"}})
+    config.load_config()
+
+    config.create_default_user_config()
+
+    assert user_config_path.exists()
+    assert config.load_user_config() == config.load_default_config()
+    assert config.load_config() == config.load_default_config()
+
+
+def test_user_config_is_read_once(user_config_path: Path) -> None:
+    config.save_user_config({"main_window": {"background": "#000000"}})
+    loaded = config.load_user_config()
+
+    user_config_path.write_text("{}")
+
+    assert config.load_user_config() is loaded
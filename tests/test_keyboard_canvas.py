@@ -0,0 +1,60 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from keyboard_visualizer.core.keyboard_manager import KeyboardManager
+from keyboard_visualizer.ui.components.keyboard_canvas import KeyboardCanvas
+
+
+@pytest.fixture
+def canvas(qtbot: Any, layout: Dict[str, List[Dict[str, Any]]]) -> KeyboardCanvas:
+    """A canvas holding the shared test layout."""
+    canvas = KeyboardCanvas(KeyboardManager())
+    qtbot.addWidget(canvas)
+    canvas.loadConfiguration(layout)
+    return canvas
+
+
+def test_scan_code_index_skips_unbound_keys(canvas: KeyboardCanvas) -> None:
+    index = canvas.scanCodeIndex()
+
+    assert sorted(index) == [30, 31]
+    assert index[30].key_bind == "a"
+    assert canvas.scanCodeIndex() is index
+
+
+def test_scan_code_index_follows_removed_keys(
+    qtbot: Any, canvas: KeyboardCanvas
+) -> None:
+    key = canvas.scanCodeIndex()[30]
+
+    with qtbot.waitSignal(canvas.keys_changed):
+        canvas.removeKey(key)
+
+    assert sorted(canvas.scanCodeIndex()) == [31]
+    with qtbot.assertNotEmitted(canvas.keys_changed):
+        key.rebound.emit()
+
+
+def test_scan_code_index_follows_rebound_keys(
+    qtbot: Any, canvas: KeyboardCanvas
+) -> None:
+    key = canvas.scanCodeIndex()[30]
+
+    key.scan_code = 32
+    with qtbot.waitSignal(canvas.keys_changed):
+        key.rebound.emit()
+
+    assert canvas.scanCodeIndex() == {31: canvas.keys[1], 32: key}
+
+
+def test_scan_code_index_follows_loaded_layouts(
+    canvas: KeyboardCanvas, layout: Dict[str, List[Dict[str, Any]]]
+) -> None:
+    canvas.scanCodeIndex()
+
+    canvas.loadConfiguration({"keys": layout["keys"][1:]})
+
+    assert sorted(canvas.scanCodeIndex()) == [31]
+    canvas.clearKeys()
+    assert canvas.scanCodeIndex() == {}
@@ -0,0 +1,73 @@
+from typing import Any, List
+
+import pytest
+from PyQt6.QtWidgets import QWidget
+
+from keyboard_visualizer.ui.components.keyboard_key import KeyboardKey
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch: pytest.MonkeyPatch) -> List[KeyboardKey]:
+    """An empty key pool, so tests don't share released keys."""
+    keys: List[KeyboardKey] = []
+    monkeypatch.setattr(KeyboardKey, "_pool", keys)
+    monkeypatch.setattr(KeyboardKey, "_live", 0)
+    monkeypatch.setattr(KeyboardKey, "_pool_limit", 0)
+    return keys
+
+
+@pytest.fixture
+def canvas(qtbot: Any) -> QWidget:
+    canvas = QWidget()
+    qtbot.addWidget(canvas)
+    return canvas
+
+
+def test_released_key_is_inert(canvas: QWidget, pool: List[KeyboardKey]) -> None:
+    key = KeyboardKey.acquire("A", "a", 30, canvas)
+    key.pressed = True
+    key.selected = True
+    rebinds: List[bool] = []
+    key.rebound.connect(lambda: rebinds.append(True))
+
+    key.release()
+    key.rebound.emit()
+
+    assert pool == [key]
+    assert key.parentWidget() is None
+    assert not key.isVisible()
+    assert not key.pressed and not key.selected
+    assert key.sound_effect is None
+    assert rebinds == []
+
+
+def test_acquire_reuses_released_key_as_new(
+    canvas: QWidget, pool: List[KeyboardKey]
+) -> None:
+    key = KeyboardKey.acquire("A", "a", 30, canvas)
+    key.setFixedSize(80, 60)
+    key.release()
+
+    reused = KeyboardKey.acquire("S", "s", 31, canvas)
+
+    assert reused is key
+    assert pool == []
+    assert (reused.label, reused.key_bind, reused.scan_code) == ("S", "s", 31)
+    assert reused.parentWidget() is canvas
+    assert reused.size().width() == reused.size().height() == 40
+    assert not reused.pressed and not reused.selected
+
+
+def test_pool_is_capped_at_most_keys_in_use(
+    qtbot: Any, canvas: QWidget, pool: List[KeyboardKey]
+) -> None:
+    keys = [KeyboardKey.acquire(parent=canvas) for _ in range(2)]
+    for key in keys:
+        key.release()
+    assert pool == keys
+
+    extra = KeyboardKey(parent=canvas)
+    with qtbot.waitSignal(extra.destroyed):
+        extra.release()
+
+    assert pool == keys
@@ -0,0 +1,48 @@
+import socket
+from typing import Any, List
+
+import pytest
+from PyQt6.QtWidgets import QMessageBox
+
+from keyboard_visualizer.core.keyboard_manager import KeyboardManager
+from keyboard_visualizer.ui.dialogs.settings_dialog import KeyBindDialog
+
+
+@pytest.fixture
+def errors(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Messages of every error box shown, in order."""
+    messages: List[str] = []
+    monkeypatch.setattr(
+        QMessageBox, "critical", lambda parent, title, text: messages.append(text)
+    )
+    return messages
+
+
+def test_helper_closing_the_connection_stops_the_manager() -> None:
+    manager = KeyboardManager()
+    manager.connection, helper = socket.socketpair(
+        socket.AF_UNIX, socket.SOCK_SEQPACKET
+    )
+    helper.close()
+
+    assert manager.update_key_states() == {}
+
+    assert manager.connection is None
+    assert manager.notifier is None
+    assert manager.helper_process is None
+    assert not manager.start_monitoring([30])
+    assert not manager.monitoring
+    assert not manager.capture_key()
+
+
+def test_key_bind_dialog_reports_a_stopped_helper(
+    qtbot: Any, errors: List[str]
+) -> None:
+    dialog = KeyBindDialog(KeyboardManager())
+    qtbot.addWidget(dialog)
+
+    assert not dialog.reset()
+
+    assert errors == ["Failed to capture key: keyboard helper stopped."]
+    dialog.keyboard_manager.key_captured.emit({"name": "a", "scan_code": 30})
+    assert dialog.key_info is None
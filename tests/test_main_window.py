@@ -0,0 +1,78 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from keyboard_visualizer.core.keyboard_manager import KeyboardManager
+from keyboard_visualizer.ui.components.keyboard_key import KeyboardKey
+from keyboard_visualizer.ui.main_window import MainWindow
+
+
+@pytest.fixture
+def monitored(monkeypatch: pytest.MonkeyPatch) -> List[List[int]]:
+    """Scan codes passed to every start_monitoring() call, in order."""
+    calls: List[List[int]] = []
+
+    def start_monitoring(self: KeyboardManager, scan_codes: List[int]) -> bool:
+        calls.append(sorted(scan_codes))
+        return True
+
+    monkeypatch.setattr(KeyboardManager, "start_monitoring", start_monitoring)
+    monkeypatch.setattr(KeyboardManager, "stop_monitoring", lambda self: True)
+    return calls
+
+
+@pytest.fixture
+def played(monkeypatch: pytest.MonkeyPatch) -> List[KeyboardKey]:
+    """Keys whose sound was played, in order."""
+    keys: List[KeyboardKey] = []
+    monkeypatch.setattr(KeyboardKey, "playSound", lambda self: keys.append(self))
+    return keys
+
+
+@pytest.fixture
+def window(
+    qtbot: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    monitored: List[List[int]],
+    layout: Dict[str, List[Dict[str, Any]]],
+) -> MainWindow:
+    """A main window whose keyboard manager doesn't need sudo or a helper."""
+    monkeypatch.setattr(KeyboardManager, "authenticate", lambda self: True)
+    monkeypatch.setattr(KeyboardManager, "start", lambda self: True)
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.canvas.loadConfiguration(layout)
+    return window
+
+
+def test_removed_key_stops_reacting_in_visualizer_mode(
+    window: MainWindow, monitored: List[List[int]], played: List[KeyboardKey]
+) -> None:
+    window.toggleMode()
+    assert not window.canvas.editor_mode
+    assert monitored[-1] == [30, 31]
+
+    removed = window.key_map[30]
+    window.canvas.removeKey(removed)
+
+    assert 30 not in window.key_map
+    assert monitored[-1] == [31]
+
+    window.keyboard_manager.state_changed.emit({30: True, 31: True})
+    assert not removed.pressed
+    assert played == [window.key_map[31]]
+
+
+def test_loading_a_layout_while_visualizing_refreshes_key_map(
+    window: MainWindow,
+    monitored: List[List[int]],
+    layout: Dict[str, List[Dict[str, Any]]],
+) -> None:
+    window.toggleMode()
+    old_key = window.key_map[30]
+
+    window.canvas.loadConfiguration({"keys": layout["keys"][1:]})
+
+    assert list(window.key_map) == [31]
+    assert old_key not in window.canvas.keys
+    assert monitored[-1] == [31]